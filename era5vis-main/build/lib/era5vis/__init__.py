@@ -1,6 +0,0 @@
-# This is a hard coded version string.
-# Real packages use more sophisticated methods to make sure that this
-# string is synchronised with `setup.py`, but for our purposes this is OK
-__version__ = '0.0.1'
-
-from era5vis.core import write_html
@@ -16,6 +16,7 @@ Edited by Lina Brückner, January 2026:
     - Added option for own datafile usage
 """
 
+from functools import lru_cache
 import webbrowser
 import logging
 from era5vis.data_access.era5_cache import Era5Cache
@@ -25,6 +26,18 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _browser():
+    """
+    Return the web browser controller, looked up once per session.
+
+    ``webbrowser.get`` probes the environment for available browsers on
+    every call, which adds up when plots are generated in a loop.
+    """
+
+    return webbrowser.get()
+
+
 def run_analysis_plots(
     parameter=None,
     level=None,
@@ -216,7 +229,7 @@ def run_analysis_plots(
 
     # open browser or print path
     if not no_browser:
-        webbrowser.get().open_new_tab(f"file://{html_path}")
+        _browser().open_new_tab(f"file://{html_path}")
     
     print("File successfully generated at:", html_path)
 
@@ -7,8 +7,11 @@ used by multiple submodules, including:
 - paths to HTML templates
 - default and example ERA5 data files
 - a global reference to the currently active ERA5 dataset
+- the xarray engine used to read ERA5 NetCDF files
+- the compression level of generated PNG images
 """
 
+from importlib.util import find_spec
 from pathlib import Path
 
 # ---------------------------------------------------------------------
@@ -30,6 +33,21 @@ datafile: Path | None = None
 example_datafile = Path(pkgdir) / "data" / "era5_example_data.nc"
 # default path where downloaded ERA5 data are stored
 downloaded_datafile = Path.cwd() / "era5_download.nc"
+# xarray engine used to open ERA5 NetCDF files; ERA5 files are HDF5
+# based, so h5netcdf is preferred when installed. None lets xarray pick;
+# files h5netcdf cannot read (netCDF3) fall back to xarray's choice.
+netcdf_engine: str | None = "h5netcdf" if find_spec("h5netcdf") else None
+# interpolate vertical cross sections with a numba-compiled kernel; off
+# by default, since compiling costs more than a single transect takes
+use_numba: bool = False
+
+# ---------------------------------------------------------------------
+# Output configuration
+# ---------------------------------------------------------------------
+
+# zlib compression level (0-9) of generated PNG images; low levels
+# encode much faster for slightly larger files
+png_compress_level: int = 1
 
 
 def set_datafile(path: Path):
@@ -42,6 +42,9 @@ import argparse
 import yaml
 from era5vis.utils.cli_or_config import cli_or_config
 
+# use the libyaml-based (C) loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def analysis_plots(args):
     """
@@ -297,7 +300,7 @@ def _load_config(config_path):
         raise ValueError("Config must be a .yaml or .yml file")
 
     with open(config_path, "r") as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=_YAML_LOADER)
 
 
 def _merge_config_and_args(args, config):
@@ -16,6 +16,8 @@ Updated by Lina Brückner, January 2026:
     - Added HTML writers for scalar-with-wind maps and Skew-T diagrams
 """
 
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
 from pathlib import Path
 from tempfile import mkdtemp
 import shutil
@@ -54,6 +56,158 @@ def mkdir(path, reset=False):
     return path
 
 
+def _extract_scalar_with_wind(scalar, u, v, level, time, datafile):
+    """
+    Check and extract the fields of a scalar-with-wind map.
+
+    The datafile is opened once for all checks and extractions.
+
+    Returns
+    -------
+    tuple of xarray.DataArray
+        Horizontal cross sections of ``scalar``, ``u`` and ``v``.
+
+    Raises
+    ------
+    KeyError
+        If a variable is not found in the datafile.
+    ValueError
+        If the level or time is not available.
+    """
+
+    with era5.open_dataset(datafile) as ds:
+        for var in (scalar, u, v):
+            era5.check_data_availability(var, level=level, time=time, ds=ds)
+
+        return tuple(
+            era5.horiz_cross_section(var, level, time, datafile, ds=ds)
+            for var in (scalar, u, v)
+        )
+
+
+def _extract_skewT(lat, lon, time, datafile):
+    """
+    Check and extract the vertical profiles of a Skew-T diagram.
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        Pressure, temperature, dewpoint and wind components, see
+        :func:`graphics.extract_skewT_profile`.
+
+    Raises
+    ------
+    KeyError
+        If a profile variable is not found in the datafile.
+    ValueError
+        If the time is not available.
+    """
+
+    with era5.open_dataset(datafile) as ds:
+        for var in ("t", "q", "u", "v"):
+            era5.check_data_availability(var, time=time, ds=ds)
+
+    return graphics.extract_skewT_profile(lat=lat, lon=lon, time=time, datafile=datafile)
+
+
+def _render_png(job):
+    """
+    Render the single PNG plot described by ``job``.
+
+    This is the worker of :func:`render_pngs`. It opens the datafile
+    itself, so that worker processes do not share any state.
+
+    Parameters
+    ----------
+    job : dict
+        Plot description, see :func:`render_pngs`.
+
+    Returns
+    -------
+    str or pathlib.Path
+        Path to the generated PNG file.
+
+    Raises
+    ------
+    KeyError
+        If a variable is not found in the datafile.
+    ValueError
+        If the plot type is unknown, or the level or time is not available.
+    """
+
+    job = dict(job)
+    plot_type = job.pop("plot_type")
+    datafile = job.pop("datafile")
+    savepath = job.pop("savepath")
+
+    if plot_type == "scalar_wind":
+        da, u_da, v_da = _extract_scalar_with_wind(
+            job["scalar"], job.get("u", "u"), job.get("v", "v"),
+            job["level"], job["time"], datafile,
+        )
+        graphics.plot_scalar_with_wind(
+            da, u_da, v_da, savepath=savepath, step=job.get("step", 9)
+        )
+    elif plot_type == "skewT":
+        lat, lon, time = job["lat"], job["lon"], job["time"]
+        p, T, Td, u, v = _extract_skewT(lat, lon, time, datafile)
+        graphics.plot_skewT(
+            p, T, Td, u, v, lat=lat, lon=lon, time=time, savepath=savepath
+        )
+    else:
+        raise ValueError(
+            f"Unknown plot type '{plot_type}'. Use 'scalar_wind' or 'skewT'."
+        )
+
+    return savepath
+
+
+def render_pngs(jobs, max_workers=None):
+    """
+    Render several PNG plots in parallel worker processes.
+
+    Figure rendering is CPU-bound, so independent plots (e.g. one map
+    per time step or pressure level) are spread over processes rather
+    than threads.
+
+    The workers are started with the ``spawn`` method, which re-imports
+    the calling script in every worker. Scripts calling this function
+    must therefore protect their entry point with
+    ``if __name__ == "__main__":``.
+
+    Parameters
+    ----------
+    jobs : iterable of dict
+        One dict per plot with the keys ``"plot_type"``
+        (``"scalar_wind"`` or ``"skewT"``), ``"datafile"`` and
+        ``"savepath"``. Scalar-with-wind maps also need ``"scalar"``,
+        ``"level"`` and ``"time"`` (optionally ``"u"``, ``"v"`` and
+        ``"step"``); Skew-T diagrams need ``"lat"``, ``"lon"`` and
+        ``"time"``.
+    max_workers : int, optional
+        Number of worker processes. Defaults to the number of CPUs.
+        With a single worker or a single job, plots are rendered in the
+        calling process.
+
+    Returns
+    -------
+    list
+        Paths to the generated PNG files, in the order of ``jobs``.
+    """
+
+    jobs = list(jobs)
+
+    # skip the process pool start-up when there is nothing to parallelize
+    if max_workers == 1 or len(jobs) <= 1:
+        return [_render_png(job) for job in jobs]
+
+    # spawn fresh interpreters: forking a process that has already opened
+    # NetCDF/HDF5 files or started threads can deadlock the workers
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=context) as executor:
+        return list(executor.map(_render_png, jobs))
+
+
 def write_scalar_with_wind_html(
     scalar,
     u,
@@ -120,8 +274,6 @@ def write_scalar_with_wind_html(
 
     # check that dataset exists abd contains the required variables
     era5.check_file_availability(datafile)
-    for var in (scalar, u, v):
-        era5.check_data_availability(var, level=level, time=time, datafile=datafile)
 
     # create a temporary output directory if necessary
     if directory is None:
@@ -130,10 +282,8 @@ def write_scalar_with_wind_html(
 
     print("Extracting data")
 
-    # extract horizontal cross sections for scalar and wind components
-    da = era5.horiz_cross_section(scalar, level, time, datafile)
-    u_da = era5.horiz_cross_section(u, level, time, datafile)
-    v_da = era5.horiz_cross_section(v, level, time, datafile)
+    # check and extract horizontal cross sections for scalar and wind components
+    da, u_da, v_da = _extract_scalar_with_wind(scalar, u, v, level, time, datafile)
 
     print("Plotting data")
 
@@ -221,13 +371,8 @@ def write_skewT_html(
     time_safe = str(time).replace(":", "-").replace(" ", "_")
     png = Path(directory) / f"SkewT_{lat:.2f}_{lon:.2f}_{time_safe}.png"
 
-    # extract vertical profile data
-    p, T, Td, u, v = graphics.extract_skewT_profile(
-        lat=lat,
-        lon=lon,
-        time=time,
-        datafile=datafile,
-    )
+    # check and extract vertical profile data
+    p, T, Td, u, v = _extract_skewT(lat, lon, time, datafile)
 
     # generate PNG plot
     graphics.plot_skewT(
@@ -18,7 +18,7 @@ from pathlib import Path
 import pandas as pd
 from era5vis.data_access.download_era5 import download_era5_data
 from era5vis.data_access.era5_request import Era5Request
-from era5vis.utils.hashing import request_hash
+from era5vis.utils.hashing import legacy_request_hash, request_hash
 
 # complete list of ERA5 pressure levels used for vertical profiles
 ALL_PRESSURE_LEVELS = [
@@ -124,6 +124,11 @@ class Era5Cache:
         if target.exists():
             return target
 
+        # reuse files cached under the SHA-256 based names of earlier versions
+        legacy = self.cache_dir / f"era5_{legacy_request_hash(req_dict)}.nc"
+        if legacy.exists():
+            return legacy
+
         # otherwise, download the data
         download_era5_data(req_dict, target=target)
 
@@ -7,6 +7,7 @@ datasets. It provides functionality to:
 - verify that an ERA5 data file exists and can be opened
 - validate the availability of variables, pressure levels and times
 - extract horizontal cross sections at a given pressure level and time
+- interpolate fields onto straight transects for vertical cross sections
 
 Edits:
 Leah Herrfurth, December 2025:
@@ -14,18 +15,74 @@ Leah Herrfurth, December 2025:
     
 """
 
+import os
+from contextlib import nullcontext
+from datetime import datetime
+from functools import lru_cache
+
 import xarray as xr
 import numpy as np
 import pandas as pd
 
+from era5vis import cfg
+
+# files are only read, so HDF5 file locking is unnecessary overhead
+os.environ.setdefault("HDF5_USE_FILE_LOCKING", "FALSE")
+
+
+def open_dataset(datafile, **kwargs):
+    """
+    Open an ERA5 NetCDF data file with the configured xarray engine.
+
+    Files the configured engine cannot read, such as netCDF3/classic
+    files, are opened with xarray's default engine instead.
+
+    Parameters
+    ----------
+    datafile : str or pathlib.Path
+        Path to the ERA5 NetCDF file.
+    **kwargs
+        Additional keyword arguments passed to ``xarray.open_dataset``.
+
+    Returns
+    -------
+    xarray.Dataset
+        The lazily opened dataset.
+    """
+
+    if "engine" in kwargs or cfg.netcdf_engine is None:
+        return xr.open_dataset(datafile, **kwargs)
+
+    try:
+        return xr.open_dataset(datafile, engine=cfg.netcdf_engine, **kwargs)
+    except FileNotFoundError:
+        raise
+    except OSError:
+        # netCDF3/classic files are not HDF5 based and cannot be read by
+        # h5netcdf; let xarray pick an engine for them
+        return xr.open_dataset(datafile, **kwargs)
+
+
+def _open_or_reuse(datafile, ds=None):
+    """
+    Return a context manager yielding ``ds``, or the loaded ``datafile``.
+
+    Passing an already opened dataset lets callers that run several
+    checks or extractions on the same file open it only once.
+    """
+
+    if ds is not None:
+        return nullcontext(ds)
+    return open_dataset(datafile).load()
+
 
 def check_file_availability(datafile):
     """
     Check whether an ERA5 NetCDF data file exists and can be opened.
 
-    This function attempts to open and fully load the dataset using
-    xarray. It is intended as an early sanity check before performing
-    any data extraction or plotting.
+    This function attempts to open the dataset using xarray, which
+    reads its metadata but no data values. It is intended as an early
+    sanity check before performing any data extraction or plotting.
 
     Parameters
     ----------
@@ -40,9 +97,10 @@ def check_file_availability(datafile):
         If the file exists but cannot be opened or parsed.
     """
 
-    # attempt to open and fully load the dataset
+    # attempt to open the dataset; the data are read later, only where
+    # they are needed
     try:
-        with xr.open_dataset(datafile).load() as ds:
+        with open_dataset(datafile):
             pass
     except FileNotFoundError:
         raise FileNotFoundError(
@@ -59,7 +117,8 @@ def check_data_availability(
  level=None,
  time=None,
  time_ind=None,
- datafile=None
+ datafile=None,
+ ds=None
 ):
     """
     Check whether a variable, pressure level, and time exist in an ERA5 dataset.
@@ -79,6 +138,9 @@ def check_data_availability(
         Time index to validate.
     datafile : str or pathlib.Path
         Path to the ERA5 NetCDF file.
+    ds : xarray.Dataset, optional
+        Already opened ERA5 dataset. If given, ``datafile`` is not
+        opened again.
 
     Raises
     ------
@@ -91,7 +153,7 @@ def check_data_availability(
     """
 
     # open and fully load the dataset to ensure all metadata are available
-    with xr.open_dataset(datafile).load() as ds:
+    with _open_or_reuse(datafile, ds) as ds:
         # check variable existence
         if param not in ds.variables:
             raise KeyError(
@@ -156,13 +218,13 @@ def check_data_availability(
                 )
 
             
-def horiz_cross_section(param, lvl, time, datafile):
+def horiz_cross_section(param, lvl, time, datafile, ds=None):
     """
     Extract a horizontal cross section from ERA5 data.
 
     The cross section is extracted at a given pressure level and time.
-    Time can be specified either as a datetime string or as an integer
-    index into the ``valid_time`` dimension.
+    Time can be specified either as a datetime (string or object) or as
+    an integer index into the ``valid_time`` dimension.
 
     Parameters
     ----------
@@ -170,12 +232,15 @@ def horiz_cross_section(param, lvl, time, datafile):
         ERA5 variable name.
     lvl : int
         Pressure level in hPa.
-    time : str or int
-        Datetime string (e.g. ``YYYYmmddHHMM``) or time index.
+    time : str, numpy.datetime64, datetime.datetime, pandas.Timestamp or int
+        Datetime string (e.g. ``YYYYmmddHHMM``), datetime object or
+        time index.
     datafile : str or pathlib.Path
         Path to the ERA5 NetCDF file.
+    ds : xarray.Dataset, optional
+        Already opened ERA5 dataset. If given, ``datafile`` is not
+        opened again and only the selected field is loaded.
 
-    
     Returns
     -------
     xarray.DataArray
@@ -185,18 +250,216 @@ def horiz_cross_section(param, lvl, time, datafile):
     Raises
     ------
     TypeError
-        If ``time`` is neither a string nor an integer.
+        If ``time`` is neither a datetime nor an integer.
     """
     
-    # open and fully load dataset
-    with xr.open_dataset(datafile).load() as ds:
-        # select by nearest valid_time if time is given as a string
-        if isinstance(time, str):
+    # open and fully load dataset, or reuse the given one
+    with _open_or_reuse(datafile, ds) as ds:
+        # select by nearest valid_time if time is given as a string or
+        # datetime object (pandas.Timestamp is a datetime subclass)
+        if isinstance(time, (str, np.datetime64, datetime)):
             da = ds[param].sel(pressure_level=lvl).sel(valid_time=time, method="nearest")
         # select by index if time is given as an integer
         elif isinstance(time, int):
             da = ds[param].sel(pressure_level=lvl).isel(valid_time=time)
         else:
-            raise TypeError("Time must be a time format string or integer")
+            raise TypeError("Time must be a time format string, datetime or integer")
+
+        # read the selected field while the dataset is open
+        da = da.load()
 
     return da
+
+
+def _fractional_index(grid, x):
+    """
+    Locate positions on a regular 1D grid for linear interpolation.
+
+    Parameters
+    ----------
+    grid : numpy.ndarray
+        Regularly spaced, ascending or descending grid coordinates.
+    x : numpy.ndarray
+        Positions to locate.
+
+    Returns
+    -------
+    i0 : numpy.ndarray of int
+        Index of the grid point preceding each position.
+    w : numpy.ndarray of float
+        Interpolation weight of the following grid point ``i0 + 1``.
+        NaN for positions outside the grid.
+    """
+
+    grid = np.asarray(grid, dtype=float)
+    f = (np.asarray(x, dtype=float) - grid[0]) / (grid[1] - grid[0])
+    i0 = np.clip(np.floor(f), 0, grid.size - 2).astype(np.intp)
+    w = np.where((f >= 0) & (f <= grid.size - 1), f - i0, np.nan)
+    return i0, w
+
+
+def _bilinear_levels_numpy(arr, i0, j0, wi, wj, out):
+    """
+    Bilinear interpolation of all levels of ``arr`` onto transect points.
+
+    ``arr`` has shape (level, lat, lon); the result is written to
+    ``out`` with shape (level, point).
+    """
+
+    out[:] = (
+        (1 - wi) * (1 - wj) * arr[:, i0, j0]
+        + wi * (1 - wj) * arr[:, i0 + 1, j0]
+        + (1 - wi) * wj * arr[:, i0, j0 + 1]
+        + wi * wj * arr[:, i0 + 1, j0 + 1]
+    )
+
+
+@lru_cache(maxsize=None)
+def _bilinear_levels_numba():
+    """
+    Compile the numba version of ``_bilinear_levels_numpy`` on first use.
+
+    numba is optional and only imported here, so that importing era5vis
+    does not pay for it. Returns None if numba is not installed.
+    """
+
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+
+    # fastmath is not used: NaN weights mark points outside the grid
+    @njit(cache=True)
+    def kernel(arr, i0, j0, wi, wj, out):
+        for lev in range(arr.shape[0]):
+            for p in range(i0.size):
+                i, j = i0[p], j0[p]
+                out[lev, p] = (
+                    (1 - wi[p]) * (1 - wj[p]) * arr[lev, i, j]
+                    + wi[p] * (1 - wj[p]) * arr[lev, i + 1, j]
+                    + (1 - wi[p]) * wj[p] * arr[lev, i, j + 1]
+                    + wi[p] * wj[p] * arr[lev, i + 1, j + 1]
+                )
+
+    return kernel
+
+
+def _bilinear_levels(arr, i0, j0, wi, wj, out):
+    """
+    Bilinear interpolation of all levels of ``arr`` onto transect points,
+    with numba if ``cfg.use_numba`` is set and numba is installed.
+    """
+
+    kernel = _bilinear_levels_numba() if cfg.use_numba else None
+    (kernel or _bilinear_levels_numpy)(arr, i0, j0, wi, wj, out)
+
+
+class TransectInterpolator:
+    """
+    Bilinear interpolation of ERA5 fields onto a straight transect.
+
+    The transect is sampled at ``npoints`` points evenly spaced in
+    latitude and longitude between ``start`` and ``end``. The grid
+    indices and interpolation weights only depend on the grid and the
+    transect, so they are computed once and reused for every variable
+    and time step, e.g. when animating cross sections.
+
+    Points outside the data grid are set to NaN.
+
+    Parameters
+    ----------
+    ds : xarray.Dataset
+        ERA5 dataset on a regular ``latitude``/``longitude`` grid.
+    start : tuple(float, float)
+        (lat_start, lon_start) in degrees.
+    end : tuple(float, float)
+        (lat_end, lon_end) in degrees.
+    npoints : int, default 200
+        Number of samples along the transect.
+    """
+
+    def __init__(self, ds, start, end, npoints=200):
+        self.ds = ds
+        self.lats = np.linspace(start[0], end[0], npoints)
+        self.lons = np.linspace(start[1], end[1], npoints)
+
+        # grid cell and weights of every transect point
+        self._i0, self._wi = _fractional_index(ds["latitude"].values, self.lats)
+        self._j0, self._wj = _fractional_index(ds["longitude"].values, self.lons)
+
+    def __call__(self, param, time):
+        """
+        Interpolate a variable at one or several times onto the transect.
+
+        Parameters
+        ----------
+        param : str
+            ERA5 variable name.
+        time : str, int or array_like
+            Datetime string (nearest ``valid_time`` is used) or time index.
+            A sequence of datetimes or indices selects all of them in a
+            single read, e.g. for the frames of an animation.
+
+        Returns
+        -------
+        xarray.DataArray
+            Variable along the transect with dims (pressure_level, point),
+            or (frame, pressure_level, point) if several times are given.
+        """
+
+        da = self.ds[param]
+        # integers of any type (also numpy scalars) are time indices
+        is_index = np.issubdtype(np.asarray(time).dtype, np.integer)
+        if np.ndim(time) == 0:
+            if is_index:
+                da = da.isel(valid_time=time)
+            else:
+                da = da.sel(valid_time=time, method="nearest")
+        elif is_index:
+            da = da.isel(valid_time=xr.DataArray(time, dims="frame"))
+        else:
+            times = xr.DataArray(pd.to_datetime(time), dims="frame")
+            da = da.sel(valid_time=times, method="nearest")
+        return self.interp(da)
+
+    def interp(self, da):
+        """
+        Interpolate a DataArray with latitude and longitude dims onto the transect.
+
+        Parameters
+        ----------
+        da : xarray.DataArray
+            Field with ``latitude`` and ``longitude`` dimensions.
+
+        Returns
+        -------
+        xarray.DataArray
+            Field along the transect, with the horizontal dimensions
+            replaced by a trailing ``point`` dimension and ``latitude``
+            and ``longitude`` as point coordinates.
+        """
+
+        da = da.transpose(..., "latitude", "longitude")
+
+        # flatten all leading dimensions (levels, frames) into one axis
+        values = np.ascontiguousarray(da.values)
+        arr = values.reshape((-1,) + values.shape[-2:])
+        out = np.empty((arr.shape[0], self.lats.size), dtype=np.result_type(arr, self._wi))
+        _bilinear_levels(arr, self._i0, self._j0, self._wi, self._wj, out)
+        out = out.reshape(values.shape[:-2] + (self.lats.size,))
+
+        # keep all coordinates that do not depend on the horizontal grid
+        coords = {
+            name: coord for name, coord in da.coords.items()
+            if not {"latitude", "longitude"} & set(coord.dims)
+        }
+        coords["latitude"] = ("point", self.lats)
+        coords["longitude"] = ("point", self.lons)
+
+        return xr.DataArray(
+            out,
+            dims=da.dims[:-2] + ("point",),
+            coords=coords,
+            name=da.name,
+            attrs=da.attrs,
+        )
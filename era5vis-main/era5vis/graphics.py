@@ -21,8 +21,22 @@ Updated by Ilias, January 2026:
     - Added vertical cross section
 """
 
-from datetime import datetime
+from functools import lru_cache
+import os
+import sys
+import matplotlib
+# render off-screen with Agg unless interactive use is requested or a
+# backend was already chosen (MPLBACKEND, or pyplot imported before);
+# this skips probing for GUI toolkits (Qt, Tk) on startup
+if not (
+    os.environ.get("ERA5VIS_INTERACTIVE")
+    or os.environ.get("MPLBACKEND")
+    or "matplotlib.pyplot" in sys.modules
+):
+    matplotlib.use("Agg", force=False)
 import matplotlib.pyplot as plt
+from matplotlib.colorbar import make_axes
+from matplotlib.ticker import MaxNLocator
 import cartopy.crs as ccrs
 import cartopy.feature as cfeature
 from cartopy.mpl.ticker import LongitudeFormatter, LatitudeFormatter
@@ -31,106 +45,470 @@ from metpy.plots import SkewT, Hodograph
 from metpy.units import units
 import metpy.calc as mpcalc
 import numpy as np
+import pandas as pd
 from metpy.calc import wind_speed
+from shapely.geometry import box
+
+from era5vis import cfg, era5
+
+# mean Earth radius used for distances along transects
+EARTH_RADIUS_KM = 6371.0
+# map projection shared by all horizontal plots
+_PC = ccrs.PlateCarree()
+# ContourPy's "serial" algorithm traces filled contours faster than the
+# default "mpl2014" one; contourf accepts it from Matplotlib 3.8 on
+_MPL_VERSION = tuple(int(x) for x in matplotlib.__version__.split(".")[:2])
+_CONTOURF_KWARGS = {"algorithm": "serial"} if _MPL_VERSION >= (3, 8) else {}
+
 
+# Natural Earth features drawn on the maps
+_FEATURES = {
+    "coastline": cfeature.COASTLINE,
+    "borders": cfeature.BORDERS,
+}
 
-def plot_scalar_with_wind(da, u, v, savepath=None, step=9):
+
+@lru_cache(maxsize=None)
+def _scaled_feature_geometries(name, scale):
+    """
+    Read the Natural Earth geometries of a map feature at ``scale`` once
+    per session.
     """
-    Plot a horizontal scalar field with wind vectors on a map.
 
-    The scalar field is displayed using filled contours, while wind
-    vectors are overlaid using quivers on a Plate Carrée projection.
+    return tuple(_FEATURES[name].with_scale(scale).geometries())
+
+
+# clipped geometries are kept for the most recently used extents only,
+# so batch runs over many domains do not keep all of them in memory
+@lru_cache(maxsize=32)
+def _feature_geometries(name, extent=None):
+    """
+    Read the Natural Earth geometries of a map feature once per session.
+
+    The resolution ("110m", "50m" or "10m") is chosen from the extent,
+    like cartopy does for ``ax.coastlines()``.
+
+    Parameters
+    ----------
+    name : {"coastline", "borders"}
+        Map feature to read.
+    extent : tuple of float, optional
+        Map extent ``(lon_min, lon_max, lat_min, lat_max)`` in degrees.
+        If given, only the parts of the geometries within (a margin
+        around) the extent are returned, and the clipped geometries are
+        cached for recently used extents. Without an extent, the coarsest
+        resolution is used.
+
+    Returns
+    -------
+    tuple of shapely.geometry.base.BaseGeometry
+        Geometries of the feature in Plate Carrée coordinates.
+    """
+
+    if extent is None:
+        return _scaled_feature_geometries(name, "110m")
+
+    # clip the session-wide geometries to the map, with a margin so no
+    # line ends visibly at the map edge
+    scale = _FEATURES[name].scaler.scale_from_extent(extent)
+    lon_min, lon_max, lat_min, lat_max = extent
+    bbox = box(lon_min - 1, lat_min - 1, lon_max + 1, lat_max + 1)
+    clipped = (
+        geom.intersection(bbox)
+        for geom in _scaled_feature_geometries(name, scale)
+        if geom.intersects(bbox)
+    )
+    return tuple(geom for geom in clipped if not geom.is_empty)
+
+
+def _savefig(fig, savepath, **kwargs):
+    """
+    Save ``fig`` to ``savepath``, encoding PNG output fast.
+
+    PNG images are written with the zlib compression level set in
+    ``cfg.png_compress_level``. Other formats are saved unchanged.
+    Keyword arguments are passed on to ``Figure.savefig``.
+    """
+
+    # the format follows from the file suffix, or from matplotlib's
+    # default for file-like objects and paths without a suffix
+    fmt = kwargs.get("format")
+    if fmt is None and isinstance(savepath, (str, os.PathLike)):
+        fmt = os.path.splitext(os.fspath(savepath))[1][1:] or None
+    if (fmt or matplotlib.rcParams["savefig.format"]).lower() == "png":
+        kwargs.setdefault("pil_kwargs", {"compress_level": cfg.png_compress_level})
+
+    fig.savefig(savepath, **kwargs)
+
+
+def _map_ticks(vmin, vmax, nbins=6):
+    """
+    Return evenly spaced tick positions between ``vmin`` and ``vmax``.
+
+    Ticks outside the range are dropped so that setting them does not
+    enlarge the map.
+    """
+
+    ticks = MaxNLocator(nbins=nbins, steps=[1, 2, 2.5, 5, 10]).tick_values(vmin, vmax)
+    return ticks[(ticks >= vmin) & (ticks <= vmax)]
+
+
+def _crop_to_extent(da, extent):
+    """
+    Select the part of a horizontal field inside a map extent.
 
     Parameters
     ----------
     da : xarray.DataArray
-        Scalar field to plot: geopotential.
-        Must contain ``latitude``, ``longitude``, ``pressure_level``,
-        and ``valid_time`` coordinates.
-    u : xarray.DataArray
-        Zonal wind component corresponding to ``da``.
-    v : xarray.DataArray
-        Meridional wind component corresponding to ``da``.
-    savepath : str or pathlib.Path, optional
-        Path where the generated PNG image will be saved.
-        If None, a filename is generated automatically.
-    step : int, default 9
-        Subsampling step for wind vectors. Values smaller than 1
-        are internally reset to 1.
+        Field with ``latitude`` and ``longitude`` coordinates; latitudes
+        may be ascending or descending (as in ERA5).
+    extent : sequence of float
+        ``[lon_min, lon_max, lat_min, lat_max]`` in degrees.
 
     Returns
     -------
-    matplotlib.figure.Figure
-        The generated Matplotlib figure.
+    xarray.DataArray
+        The cropped field.
     """
 
-    # prevent step = 0
-    if step < 1:
-        step = 1
+    lon_min, lon_max, lat_min, lat_max = extent
+    lat = da.latitude.values
+    if lat[0] > lat[-1]:
+        lat_slice = slice(lat_max, lat_min)
+    else:
+        lat_slice = slice(lat_min, lat_max)
+    return da.sel(longitude=slice(lon_min, lon_max), latitude=lat_slice)
+
+
+def _valid_datetime(da):
+    """
+    Return the (scalar) ``valid_time`` of a DataArray as a datetime.
+    """
+
+    return pd.Timestamp(da.valid_time.values).to_pydatetime()
+
+
+def _prepare_scalar_with_wind(da, u, v, extent):
+    """
+    Crop and evaluate the inputs of a scalar-with-wind map.
+
+    Returns
+    -------
+    da, u, v : xarray.DataArray
+        Inputs cropped to ``extent`` and computed if dask-backed.
+    extent : list of float
+        ``extent``, or the bounds of ``da`` if ``extent`` is None.
+    """
+
+    # only hand the plotted domain to matplotlib and cartopy
+    if extent is not None:
+        da, u, v = (_crop_to_extent(x, extent) for x in (da, u, v))
+
+    # evaluate dask-backed inputs in a single pass instead of letting
+    # matplotlib trigger one computation per array
+    if any(hasattr(x.data, "chunks") for x in (da, u, v)):
+        import dask
+        da, u, v = dask.compute(da, u, v)
+
+    if extent is None:
+        lon = da.longitude.values
+        lat = da.latitude.values
+        extent = [lon.min(), lon.max(), lat.min(), lat.max()]
+
+    return da, u, v, extent
+
+
+def _make_base_axes(extent):
+    """
+    Create the static parts of a scalar-with-wind map.
+
+    These are the figure, the map axes with coastlines, borders and
+    labelled grid lines, and the colorbar axes. None of them depend on
+    the plotted field, so they can be reused for several frames.
+
+    Parameters
+    ----------
+    extent : sequence of float
+        Map extent ``[lon_min, lon_max, lat_min, lat_max]`` in degrees.
+
+    Returns
+    -------
+    fig : matplotlib.figure.Figure
+    ax : cartopy.mpl.geoaxes.GeoAxes
+        Map axes.
+    cax : matplotlib.axes.Axes
+        Colorbar axes.
+    """
 
     # initiate figure
     fig = plt.figure(figsize=(8, 6))
-    ax = plt.axes(projection=ccrs.PlateCarree())
+    ax = plt.axes(projection=_PC)
+    # fix the extent up front so cartopy skips autoscaling to the data
+    ax.set_extent(extent, crs=_PC)
     ax.set_xlabel("Longitude")
     ax.set_ylabel("Latitude")
 
+    # add coastlines and borders from the geometries cached per extent
+    extent_key = tuple(float(x) for x in extent)
+    ax.add_geometries(
+        _feature_geometries("coastline", extent_key),
+        crs=_PC,
+        edgecolor="green",
+        facecolor="none"
+    )
+    ax.add_geometries(
+        _feature_geometries("borders", extent_key),
+        crs=_PC,
+        edgecolor="black",
+        facecolor="none",
+        linestyle=":"
+    )
+
+    # add gridlines with labels; for Plate Carrée, tick positions are
+    # plain data coordinates, which avoids cartopy's gridliner
+    ax.set_xticks(_map_ticks(extent[0], extent[1]), crs=_PC)
+    ax.set_yticks(_map_ticks(extent[2], extent[3]), crs=_PC)
+    ax.xaxis.set_major_formatter(LongitudeFormatter())
+    ax.yaxis.set_major_formatter(LatitudeFormatter())
+    ax.grid(linewidth=0.5, color="gray", alpha=0.7, linestyle="--")
+
+    # reserve space for the colorbar next to the map
+    cax, _ = make_axes(ax, orientation="vertical", pad=0.02)
+
+    return fig, ax, cax
+
+
+def _draw_scalar_with_wind(ax, cax, da, u, v, step, style):
+    """
+    Draw the field-dependent parts of a scalar-with-wind map.
+
+    Returns
+    -------
+    list of matplotlib.artist.Artist
+        The scalar field and wind vector artists, which can be removed
+        before drawing the next frame on the same axes.
+    """
+
     # extract time for title
-    time = da.valid_time.to_numpy().astype("datetime64[ms]").astype(datetime)
+    time = _valid_datetime(da)
     ax.set_title(
         f"{da.long_name} and wind barbs at {da.pressure_level.to_numpy()} "
         f"{da.pressure_level.units} ({time:%d %b %Y %H:%M})",
         fontsize=12
     )
 
-    # plot scalar as filled contours
-    cf = ax.contourf(da.longitude, da.latitude, da, levels=20, cmap="viridis")
-    cbar = plt.colorbar(cf, ax=ax, orientation="vertical", pad=0.02)
+    # pull the grid and field out of xarray once; matplotlib would
+    # otherwise convert the DataArrays on every use
+    lon = da.longitude.values
+    lat = da.latitude.values
+    values = da.values
+
+    # plot scalar field
+    if style == "pcolormesh":
+        cf = ax.pcolormesh(
+            lon,
+            lat,
+            values,
+            cmap="viridis",
+            shading="auto",
+            transform=_PC
+        )
+    else:
+        cf = ax.contourf(
+            lon,
+            lat,
+            values,
+            levels=20,
+            cmap="viridis",
+            transform=_PC,
+            **_CONTOURF_KWARGS
+        )
+    # render the scalar field (and below, the wind vectors) as single
+    # image layers in vector outputs; coastlines, borders and the grid
+    # stay vectors
+    cf.set_rasterized(True)
+    cax.clear()
+    cbar = ax.figure.colorbar(cf, cax=cax, orientation="vertical")
     cbar.set_label(f"({da.units})")
 
-    # subsample wind
-    pu = u[::step, ::step]
-    pv = v[::step, ::step]
+    # subsample wind; the fields are already cropped to the map extent,
+    # so quiver is handed plain arrays of visible vectors only
+    u_values = u.values
+    v_values = v.values
+    pu = u_values[::step, ::step]
+    pv = v_values[::step, ::step]
 
     # plot wind quivers
-    ax.quiver(
-        pu.longitude,
-        pu.latitude,
+    quiver = ax.quiver(
+        u.longitude.values[::step],
+        u.latitude.values[::step],
         pu,
         pv,
         pivot="middle",
-        transform=ccrs.PlateCarree()
+        transform=_PC,
+        rasterized=True
     )
 
-    # add coastlines and borders
-    ax.coastlines(color="green")
-    ax.add_feature(cfeature.BORDERS, linestyle=":")
-    
-    # add gridlines with labels
-    gl = ax.gridlines(
-        draw_labels=True,
-        linewidth=0.5,
-        color="gray",
-        alpha=0.7,
-        linestyle="--"
-    )
-    gl.top_labels = False
-    gl.right_labels = False
-    gl.xformatter = LongitudeFormatter()
-    gl.yformatter = LatitudeFormatter()
+    return [cf, quiver]
+
+
+def _check_style(style):
+    """
+    Raise a ValueError for unsupported scalar plotting styles.
+    """
+
+    if style not in ("pcolormesh", "contourf"):
+        raise ValueError(
+            f"Unknown style '{style}'. Use 'pcolormesh' or 'contourf'."
+        )
+
+
+def plot_scalar_with_wind(
+    da, u, v, savepath=None, step=9, style="pcolormesh", extent=None
+):
+    """
+    Plot a horizontal scalar field with wind vectors on a map.
+
+    The scalar field is displayed as a colour mesh (or filled contours),
+    while wind vectors are overlaid using quivers on a Plate Carrée
+    projection.
+    Dask-backed inputs are computed together before plotting.
+
+    Parameters
+    ----------
+    da : xarray.DataArray
+        Scalar field to plot: geopotential.
+        Must contain ``latitude``, ``longitude``, ``pressure_level``,
+        and ``valid_time`` coordinates.
+    u : xarray.DataArray
+        Zonal wind component corresponding to ``da``.
+    v : xarray.DataArray
+        Meridional wind component corresponding to ``da``.
+    savepath : str or pathlib.Path, optional
+        Path where the generated PNG image will be saved.
+        If None, a filename is generated automatically.
+    step : int, default 9
+        Subsampling step for wind vectors. Values smaller than 1
+        are internally reset to 1.
+    style : {"pcolormesh", "contourf"}, default "pcolormesh"
+        How the scalar field is drawn. ``"pcolormesh"`` is much faster
+        on a map; ``"contourf"`` draws 20 filled contour levels.
+    extent : sequence of float, optional
+        Map extent ``[lon_min, lon_max, lat_min, lat_max]`` in degrees.
+        The scalar field and wind components are cropped to it before
+        plotting. If None, the full domain of ``da`` is shown.
+
+    Returns
+    -------
+    matplotlib.figure.Figure
+        The generated Matplotlib figure.
+
+    Raises
+    ------
+    ValueError
+        If ``style`` is not one of the supported values.
+    """
+
+    _check_style(style)
+
+    # prevent step = 0
+    if step < 1:
+        step = 1
+
+    da, u, v, extent = _prepare_scalar_with_wind(da, u, v, extent)
+
+    fig, ax, cax = _make_base_axes(extent)
+    _draw_scalar_with_wind(ax, cax, da, u, v, step, style)
 
     # save figure
     if savepath is None:
-        time_safe = str(time).replace(":", "-").replace(" ", "_")
+        time_safe = str(_valid_datetime(da)).replace(":", "-").replace(" ", "_")
         filename = f"scalar_wind_{da.name}_{da.pressure_level.to_numpy()}_{time_safe}.png"
-        fig.savefig(filename, bbox_inches="tight")
+        _savefig(fig, filename, bbox_inches="tight")
         plt.close(fig)
     else:
-        fig.savefig(savepath, bbox_inches="tight")
+        _savefig(fig, savepath, bbox_inches="tight")
         plt.close(fig)
 
     return fig
 
 
+def plot_scalar_with_wind_batch(
+    das, us, vs, savepaths, step=9, style="pcolormesh", extent=None
+):
+    """
+    Plot a series of scalar fields with wind vectors on one reused map.
+
+    The figure, coastlines, borders, grid lines and colorbar axes are
+    built once; for every frame only the scalar field, wind vectors,
+    colorbar and title are redrawn before saving. This is much faster
+    than calling :func:`plot_scalar_with_wind` in a loop over time steps
+    or pressure levels. All fields must share the same grid.
+
+    Parameters
+    ----------
+    das : sequence of xarray.DataArray
+        Scalar fields to plot, see :func:`plot_scalar_with_wind`.
+    us : sequence of xarray.DataArray
+        Zonal wind components corresponding to ``das``.
+    vs : sequence of xarray.DataArray
+        Meridional wind components corresponding to ``das``.
+    savepaths : sequence of str or pathlib.Path
+        Paths where the PNG image of every frame will be saved.
+    step : int, default 9
+        Subsampling step for wind vectors.
+    style : {"pcolormesh", "contourf"}, default "pcolormesh"
+        How the scalar fields are drawn.
+    extent : sequence of float, optional
+        Map extent ``[lon_min, lon_max, lat_min, lat_max]`` in degrees.
+        If None, the domain of the first field is used.
+
+    Returns
+    -------
+    list
+        The paths of the saved images.
+
+    Raises
+    ------
+    ValueError
+        If ``style`` is not one of the supported values.
+    """
+
+    _check_style(style)
+
+    # prevent step = 0
+    if step < 1:
+        step = 1
+
+    fig = ax = cax = None
+    for da, u, v, savepath in zip(das, us, vs, savepaths):
+        da, u, v, extent = _prepare_scalar_with_wind(da, u, v, extent)
+
+        # build the static map once, for the first frame
+        if fig is None:
+            fig, ax, cax = _make_base_axes(extent)
+
+        artists = _draw_scalar_with_wind(ax, cax, da, u, v, step, style)
+        _savefig(fig, savepath, bbox_inches="tight")
+
+        # remove this frame's data before drawing the next one
+        for artist in artists:
+            artist.remove()
+
+    if fig is not None:
+        plt.close(fig)
+
+    return list(savepaths)
+
+
+def _reversed(x):
+    """
+    Return a reversed, C-contiguous copy of a 1D array.
+    """
+
+    return np.ascontiguousarray(x[::-1])
+
+
 def extract_skewT_profile(lat, lon, time, datafile, variables=None):
     """
     Extract a vertical thermodynamic and wind profile from ERA5 data.
@@ -152,18 +530,23 @@ def extract_skewT_profile(lat, lon, time, datafile, variables=None):
     datafile : str or pathlib.Path
         Path to the ERA5 NetCDF data file.
     variables : dict, optional
-        Mapping of logical variable names to dataset variable names.
+        Mapping of logical variable names (``"T"``, ``"q"``, ``"u"``,
+        ``"v"``) to dataset variable names. If it also maps ``"Td"`` to
+        a dewpoint variable [K], the dewpoint is read from the dataset
+        instead of being computed from specific humidity.
 
     Returns
     -------
-    p : pint.Quantity
+    p : numpy.ndarray
         Pressure profile [hPa].
-    T : pint.Quantity
+    T : numpy.ndarray
         Temperature profile [°C].
-    Td : pint.Quantity
+    Td : numpy.ndarray
         Dewpoint temperature profile [°C].
-    u : pint.Quantity
+    u : numpy.ndarray
         Zonal wind profile [m s⁻¹].
+    v : numpy.ndarray
+        Meridional wind profile [m s⁻¹].
     """
 
     # use default ERA5 variable names 
@@ -175,47 +558,54 @@ def extract_skewT_profile(lat, lon, time, datafile, variables=None):
             "v": "v",
         }
 
-    # open ERA5 netcdf dataset
-    with xr.open_dataset(datafile) as ds:
-        # extract temperature profile
-        T_da = ds[variables["T"]] \
-            .sel(latitude=lat, longitude=lon, method="nearest") \
-            .sel(valid_time=time, method="nearest")
+    # dataset variables needed for the profile; specific humidity is
+    # only read when the dewpoint has to be computed from it
+    keys = ("T", "u", "v", "Td") if "Td" in variables else ("T", "u", "v", "q")
+    names = [variables[key] for key in keys]
 
-        # extract specific humidity profile
-        q_da = ds[variables["q"]] \
-            .sel(latitude=lat, longitude=lon, method="nearest") \
-            .sel(valid_time=time, method="nearest")
-
-        # extract zonal wind component profile
-        u_da = ds[variables["u"]] \
+    # open ERA5 netcdf dataset
+    with era5.open_dataset(datafile) as ds:
+        # extract all profiles with a single nearest-neighbour lookup and
+        # read the selected column into memory in one go
+        profile = ds[names] \
             .sel(latitude=lat, longitude=lon, method="nearest") \
             .sel(valid_time=time, method="nearest") \
+            .load()
+
+        # extract pressure levels [hPa] and winds [m/s] as plain arrays
+        p = profile.pressure_level.values
+        u = profile[variables["u"]].values
+        v = profile[variables["v"]].values
+
+        # convert temperatures from K to °C
+        T = profile[variables["T"]].values - 273.15
+        if "Td" in variables:
+            Td = profile[variables["Td"]].values - 273.15
+        else:
+            # compute dewpoint from specific humidity and pressure; this
+            # is the only step that needs MetPy units
+            q = profile[variables["q"]].values
+            Td = mpcalc.dewpoint_from_specific_humidity(
+                p * units.hPa, q
+            ).m_as(units.degC)
+
+        # order pressure profiles from the surface upwards, stored
+        # contiguously so plotting does not work on strided views
+        p, T, Td, u, v = (_reversed(x) for x in (p, T, Td, u, v))
 
-        # extract meridional wind component profile
-        v_da = ds[variables["v"]] \
-            .sel(latitude=lat, longitude=lon, method="nearest") \
-            .sel(valid_time=time, method="nearest")
+    return p, T, Td, u, v
 
-        # extract pressure levels
-        p = T_da.pressure_level.values * units.hPa
 
-        # convert units
-        T = (T_da.values * units.kelvin).to(units.degC)
-        u = u_da.values * units("m/s")
-        v = v_da.values * units("m/s")
-        # compute dewpoint from specific humidity and pressure
-        Td = mpcalc.dewpoint_from_specific_humidity(p, q_da.values).to(units.degC)
+def _magnitude(x, unit):
+    """
+    Return the magnitude of ``x`` in ``unit`` as a plain numpy array.
 
+    Arrays without units are assumed to be given in ``unit`` already.
+    """
 
-        # order pressure profiles from the surface upwards
-        p = p[::-1]
-        T = T[::-1]
-        Td = Td[::-1]
-        u = u[::-1]
-        v = v[::-1]
-
-    return p, T, Td, u, v
+    if hasattr(x, "to"):
+        return x.to(unit).magnitude
+    return np.asarray(x)
 
 
 def plot_skewT(p, T, Td, u, v, lat, lon, time, datafile=None, variables=None, savepath=None):
@@ -224,19 +614,20 @@ def plot_skewT(p, T, Td, u, v, lat, lon, time, datafile=None, variables=None, sa
 
     This function assumes that vertical profiles of pressure,
     temperature, dewpoint, and wind components have already
-    been extracted and converted to physical units.
+    been extracted. Inputs may carry units; they are converted to the
+    units listed below and stripped before plotting.
 
     Parameters
     ----------
-    p : pint.Quantity
+    p : pint.Quantity or array_like
         Pressure profile [hPa].
-    T : pint.Quantity
+    T : pint.Quantity or array_like
         Temperature profile [°C].
-    Td : pint.Quantity
+    Td : pint.Quantity or array_like
         Dewpoint temperature profile [°C].
-    u : pint.Quantity
+    u : pint.Quantity or array_like
         Zonal wind profile [m s⁻¹].
-    v : pint.Quantity
+    v : pint.Quantity or array_like
         Meridional wind profile [m s⁻¹].
     lat : float
         Latitude of the sounding location.
@@ -244,8 +635,8 @@ def plot_skewT(p, T, Td, u, v, lat, lon, time, datafile=None, variables=None, sa
         Longitude of the sounding location.
     time : str
         Time of the sounding.
-    savepath : str or pathlib.Path, optional
-        Path where the generated PNG image will be saved.
+    savepath : str, pathlib.Path or file-like, optional
+        Path or binary buffer where the generated PNG image will be saved.
 
     Returns
     -------
@@ -253,13 +644,20 @@ def plot_skewT(p, T, Td, u, v, lat, lon, time, datafile=None, variables=None, sa
         The generated Matplotlib figure.
     """
 
+    # strip units once so MetPy and Matplotlib work on plain arrays
+    p = _magnitude(p, units.hPa)
+    T = _magnitude(T, units.degC)
+    Td = _magnitude(Td, units.degC)
+    u = _magnitude(u, units("m/s"))
+    v = _magnitude(v, units("m/s"))
+
     # initiate figure
     fig = plt.figure(figsize=(9, 9))
     skew = SkewT(fig, rotation=45, rect=(0.1, 0.1, 0.55, 0.85))
 
     # plot temperature and dewpoint
-    skew.plot(p, T, "r", label="Temperature")
-    skew.plot(p, Td, "g", label="Dewpoint")
+    skew.ax.plot(T, p, "r", label="Temperature")
+    skew.ax.plot(Td, p, "g", label="Dewpoint")
 
     # plot wind barbs
     skew.plot_barbs(p, u, v)
@@ -291,12 +689,28 @@ def plot_skewT(p, T, Td, u, v, lat, lon, time, datafile=None, variables=None, sa
 
     # save figure
     if savepath is not None:
-        fig.savefig(savepath, bbox_inches="tight")
+        _savefig(fig, savepath, bbox_inches="tight")
         plt.close(fig)
 
     return fig
 
 
+def _haversine_km(lat0, lon0, lat1, lon1):
+    """
+    Great-circle distance in km between points given in degrees.
+
+    All arguments may be scalars or numpy arrays that broadcast
+    against each other.
+    """
+
+    lat0, lon0, lat1, lon1 = map(np.radians, (lat0, lon0, lat1, lon1))
+    a = (
+        np.sin((lat1 - lat0) / 2) ** 2
+        + np.cos(lat0) * np.cos(lat1) * np.sin((lon1 - lon0) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+
+
 def extract_vert_cross_section(
     param,
     u_param,
@@ -310,51 +724,37 @@ def extract_vert_cross_section(
     """
     Extract data for a vertical cross section along a transect.
 
+    ``time`` may be a single datetime string or time index, or a
+    sequence of them. In the latter case all times are read at once
+    and the returned arrays get a leading ``frame`` dimension, which
+    is convenient for animations.
+
     Returns
     -------
     da_main : xarray.DataArray
         Main variable interpolated along transect (pressure, point)
+        or (frame, pressure, point)
     wind : xarray.DataArray
-        Wind speed along transect (pressure, point)
+        Wind speed along transect, same dimensions as ``da_main``
     dist : ndarray
         Distance along transect in km
     """
 
     lat0, lon0 = start
-    lat1, lon1 = end
 
-    lats = np.linspace(lat0, lat1, npoints)
-    lons = np.linspace(lon0, lon1, npoints)
+    with era5.open_dataset(datafile) as ds:
+        # interpolation weights are shared by all three variables
+        transect = era5.TransectInterpolator(ds, start, end, npoints)
 
-    with xr.open_dataset(datafile) as ds:
-        da_main = (
-            ds[param]
-            .sel(valid_time=time, method="nearest")
-            .interp(latitude=("point", lats),
-                    longitude=("point", lons))
-        )
-
-        u = (
-            ds[u_param]
-            .sel(valid_time=time, method="nearest")
-            .interp(latitude=("point", lats),
-                    longitude=("point", lons))
-        )
-
-        v = (
-            ds[v_param]
-            .sel(valid_time=time, method="nearest")
-            .interp(latitude=("point", lats),
-                    longitude=("point", lons))
-        )
+        da_main = transect(param, time)
+        u = transect(u_param, time)
+        v = transect(v_param, time)
 
     wind = wind_speed(u.values * units("m/s"),
                       v.values * units("m/s")).magnitude
 
-    # distance along transect
-    dist = np.linspace(0, 1, npoints) * (
-        111 * np.hypot(lat1 - lat0, lon1 - lon0)
-    )
+    # great-circle distance of every transect point from the start point
+    dist = _haversine_km(lat0, lon0, transect.lats, transect.lons)
 
     wind = xr.DataArray(
         wind,
@@ -442,7 +842,7 @@ def plot_vert_cross_section(
     plt.tight_layout()
 
     if savepath is not None:
-        fig.savefig(savepath, dpi=150, bbox_inches="tight")
+        _savefig(fig, savepath, dpi=150, bbox_inches="tight")
         plt.close(fig)
 
     return fig
@@ -1,8 +1,6 @@
 import numpy as np
-import xarray as xr
 import matplotlib.pyplot as plt
-from era5vis import cfg
-import scipy
+from era5vis import cfg, era5
 
 def vert_cross_section(param, start, end, time, npoints=200):
     """Extract a vertical cross section from the ERA5 data.
@@ -30,32 +28,29 @@ def vert_cross_section(param, start, end, time, npoints=200):
           - lat(point), lon(point)
     """
 
-    lat0, lon0 = start
-    lat1, lon1 = end
-
-    # Create sampling points along a straight line in (lat, lon)
-    lats = np.linspace(lat0, lat1, npoints)
-    lons = np.linspace(lon0, lon1, npoints)
-
-    # Use a "point" dimension so interp returns (pressure_level, point)
-    pts = xr.DataArray(np.arange(npoints), dims=("point",), name="point")
-    lat_pts = xr.DataArray(lats, dims=("point",), coords={"point": pts})
-    lon_pts = xr.DataArray(lons, dims=("point",), coords={"point": pts})
-
-    # Same time-selection logic as horiz_cross_section
-    with xr.open_dataset(cfg.datafile).load() as ds:
+    # Same time-selection logic as horiz_cross_section; the file is
+    # opened lazily so that only the selected time step is read
+    with era5.open_dataset(cfg.datafile) as ds:
         if isinstance(time, str):
             da_t = ds[param].sel(valid_time=time)
         elif isinstance(time, int):
             da_t = ds[param].isel(valid_time=time)
         else:
             raise TypeError("time must be a time format string or integer")
+        da_t = da_t.load()
 
-        # Interpolate onto the transect (keeps all pressure levels)
-        da = da_t.interp(latitude=lat_pts, longitude=lon_pts)
+        # Bilinear interpolation onto a straight line in (lat, lon); the
+        # grid is regular, so indices and weights are computed once for
+        # the transect and applied to all pressure levels in one pass
+        transect = era5.TransectInterpolator(ds, start, end, npoints)
+        da = transect.interp(da_t)
 
     # Add convenient point coordinates for plotting/inspection
-    da = da.assign_coords(lat=("point", lats), lon=("point", lons))
+    da = da.assign_coords(
+        point=np.arange(npoints),
+        lat=("point", transect.lats),
+        lon=("point", transect.lons),
+    )
 
     # Ensure expected dim order (vertical first)
     da = da.transpose("pressure_level", "point")
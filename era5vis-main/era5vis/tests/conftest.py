@@ -10,13 +10,46 @@ Edited by Lina Brückner, January 2026:
     - Updated to single datafile usage
 """
 
-from datetime import datetime
-
+import numpy as np
 import pytest
 import xarray as xr
 import yaml
 from era5vis import cfg
 
+# use the libyaml-based (C) dumper when PyYAML was built with it
+_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+def _write_config(path, data):
+    # write a YAML configuration file for the CLI
+    path.write_text(yaml.dump(data, Dumper=_DUMPER), encoding="utf-8")
+    return path
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--runslow", action="store_true", default=False, help="also run tests marked as slow"
+    )
+
+
+def pytest_configure(config):
+    # register the pytest-xdist grouping marker, so that it is also
+    # known when the tests run without pytest-xdist
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run the marked tests on the same pytest-xdist worker"
+    )
+    config.addinivalue_line("markers", "slow: slow test, only run with --runslow")
+
+
+def pytest_collection_modifyitems(config, items):
+    # skip the slow tests (e.g. starting worker processes) by default
+    if config.getoption("--runslow"):
+        return
+    skip_slow = pytest.mark.skip(reason="needs --runslow to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
 
 @pytest.fixture(scope="session", autouse=True)
 def ensure_datafile():
@@ -27,58 +60,99 @@ def ensure_datafile():
         pytest.skip("No ERA5 example dataset available for tests.")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def datafile():
-    # return the scalar_wind dataset for testing
-    return str(cfg.example_datafile)  # path must be str for xarray
+    # return the example dataset for testing; xarray and the
+    # era5vis functions accept path-like objects directly
+    return cfg.example_datafile
+
+@pytest.fixture(scope="session")
+def dataset_manifest():
+    # read a valid parameter, level, time and location from the example
+    # dataset once per session; only coordinates are read, no data
+    with xr.open_dataset(cfg.example_datafile) as ds:
+        return {
+            "param": next(v for v in ds.data_vars if {"pressure_level", "longitude"} <= set(ds[v].dims)),
+            "level": int(ds.pressure_level[0].item()),
+            "time": ds.valid_time[0].values,
+            "lat": ds.latitude[0].item(),
+            "lon": ds.longitude[0].item(),
+        }
 
-@pytest.fixture
-def retrieve_param_level_from_ds():
 
-    # retrieve variable name and level from the dataset to make sure 
-    # that we don't call the function with bad arguments
+@pytest.fixture(scope="session")
+def scalar_wind_probe(dataset_manifest):
+    # valid scalar parameter, level and time for scalar-with-wind plots
+    m = dataset_manifest
+    return m["param"], m["level"], str(m["time"])
+
+
+@pytest.fixture(scope="session")
+def skewt_probe(dataset_manifest):
+    # valid latitude, longitude and time for Skew-T plots
+    m = dataset_manifest
+    return m["lat"], m["lon"], str(m["time"])
+
+
+@pytest.fixture(scope="session")
+def vert_cross_probe(dataset_manifest):
+    # valid time for vertical cross sections
+    return str(dataset_manifest["time"])
+
+
+@pytest.fixture(scope="session")
+def scalar_wind_arrays(dataset_manifest):
+    # scalar field and wind components at the first level and time,
+    # read once per session for the plotting tests
+    param, level = dataset_manifest["param"], dataset_manifest["level"]
     with xr.open_dataset(cfg.example_datafile) as ds:
-        param = [v for v in ds.variables if ("pressure_level" in ds[v].dims) and ("longitude" in ds[v].dims)][0]
-        level = int(ds.pressure_level.values[0])
-    
-    return param, level
-    
+        subset = ds[[param, "u", "v"]].sel(pressure_level=level).isel(valid_time=0).load()
+    return subset[param], subset["u"], subset["v"]
 
-@pytest.fixture
-def retrieve_param_level_time_from_ds():
+
+@pytest.fixture(scope="session")
+def retrieve_param_level_time_from_ds(dataset_manifest):
 
     # retrieve variable name, level, and time from the dataset to make sure 
     # that we don't call the function with bad arguments
-    with xr.open_dataset(cfg.example_datafile) as ds:
-        param = [v for v in ds.variables if ("pressure_level" in ds[v].dims) and ("longitude" in ds[v].dims)][0]
-        level = int(ds.pressure_level.values[0])
-        time = ds.valid_time.values[0].astype("datetime64[ms]").astype(datetime).strftime("%Y%m%d%H%M")
+    m = dataset_manifest
+    time = np.datetime_as_string(m["time"], unit="m") \
+        .replace("-", "").replace("T", "").replace(":", "")
     
-    return param, level, time
+    return m["param"], m["level"], time
 
-@pytest.fixture
-def retrieve_param_level_time_wind_from_ds():
+@pytest.fixture(scope="session")
+def retrieve_param_level_time_wind_from_ds(retrieve_param_level_time_from_ds):
 
-    with xr.open_dataset(cfg.example_datafile) as ds:
-        param = [v for v in ds.variables if ("pressure_level" in ds[v].dims) and ("longitude" in ds[v].dims)][0]
-        level = int(ds.pressure_level.values[0])
-        time = ds.valid_time.values[0].astype("datetime64[ms]").astype(datetime).strftime("%Y%m%d%H%M")
-        u = "u"
-        v = "v"
+    param, level, time = retrieve_param_level_time_from_ds
+    u = "u"
+    v = "v"
     
     return param, level, time, u, v
 
-@pytest.fixture
-def temp_incomplete_config_files(tmp_path, retrieve_param_level_time_from_ds):
+@pytest.fixture(scope="session")
+def write_config():
+    """
+    Provide a function ``write_config(path, data)`` that writes ``data``
+    as a YAML configuration file to ``path`` and returns ``path``.
+    """
+    return _write_config
+
+
+@pytest.fixture(scope="session")
+def temp_incomplete_config_files(tmp_path_factory, retrieve_param_level_time_from_ds):
     """
     Create temporary YAML configuration files missing either 'parameter' or 'level'.
 
+    The files are read-only inputs, so they are written once per session.
+
     Returns
     -------
     list[Path]
         List of paths to the temporary config files.
     """
     param, level, time = retrieve_param_level_time_from_ds
+    tmp_path = tmp_path_factory.mktemp("incomplete_configs")
     configs = []
 
     # Config 1: no parameter
@@ -91,8 +165,7 @@ def temp_incomplete_config_files(tmp_path, retrieve_param_level_time_from_ds):
             "no_browser": True,
         }
     }
-    with open(config1, "w") as f:
-        yaml.safe_dump(data1, f)
+    _write_config(config1, data1)
     configs.append(config1)
 
     # Config 2: no level
@@ -105,51 +178,7 @@ def temp_incomplete_config_files(tmp_path, retrieve_param_level_time_from_ds):
             "no_browser": True,
         }
     }
-    with open(config2, "w") as f:
-        yaml.safe_dump(data2, f)
+    _write_config(config2, data2)
     configs.append(config2)
 
     return configs
-
-
-@pytest.fixture
-def incomplete_test_cases(retrieve_param_level_time_from_ds, temp_incomplete_config_files):
-    """
-    Combine CLI-only and config-only test cases for missing arguments.
-
-    Returns
-    -------
-    list[list[str]]
-        List of argument lists representing incomplete test cases.
-    """
-    return make_incomplete_test_cases(retrieve_param_level_time_from_ds, temp_incomplete_config_files)
-
-
-def make_incomplete_test_cases(retrieve_param_level_time_from_ds, temp_config_files):
-    """
-    Helper function to generate incomplete test cases.
-
-    Parameters
-    ----------
-    retrieve_param_level_time_from_ds : tuple
-        (parameter, level, time)
-    temp_config_files : list[Path]
-        List of paths to incomplete YAML configuration files.
-
-    Returns
-    -------
-    list[list[str]]
-        List of argument lists for CLI tests.
-    """
-    param, level, _ = retrieve_param_level_time_from_ds
-    cases = []
-
-    # CLI-only incomplete cases
-    cases.append(["--pl", "scalar_wind", "-p", str(param), "--no-browser"])
-    cases.append(["--pl", "scalar_wind", "--lvl", str(level), "--no-browser"])
-
-    # config-only incomplete cases
-    for config_file in temp_config_files:
-        cases.append([str(config_file)])
-
-    return cases
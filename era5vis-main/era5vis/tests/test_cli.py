@@ -8,43 +8,54 @@ Edited by Lina Brückner, January 2026
     - Added parameters u and v
 """
 
+from types import SimpleNamespace
+
 import era5vis
 
 import pytest
-import yaml
 
 from era5vis.cli import analysis_plots
 
 
-@pytest.mark.parametrize("args", [
-    [],
-    ["-h"],
-    ["--help"],
-])
-def test_help(capsys, args):
-    """Test that help flags print usage information and exit."""
-    # CLI exit after printing help
-    with pytest.raises(SystemExit) as exc:
-        analysis_plots(args)
+@pytest.fixture
+def stub_writers(monkeypatch, tmp_path):
+    """
+    Replace the HTML writers in ``core`` with a stub.
 
-    assert exc.value.code == 0
-    captured = capsys.readouterr()
-    assert "usage: era5vis_analysis_plots" in captured.out
+    The CLI tests only check argument and config handling; the plotting
+    pipeline itself is covered by ``test_core.py``. Returns the list of
+    keyword arguments the writers were called with.
+    """
+
+    calls = []
+
+    def fake_writer(*args, **kwargs):
+        calls.append(kwargs)
+        out = tmp_path / "index.html"
+        out.write_text("")
+        return out
+
+    for name in ("write_scalar_with_wind_html", "write_skewT_html", "write_vert_cross_html"):
+        monkeypatch.setattr(f"era5vis.core.{name}", fake_writer)
+    return calls
 
 
-@pytest.mark.parametrize("args", [
-    ["--v"],
-    ["--version"],
+@pytest.mark.parametrize("args, expected", [
+    ([], b"usage: era5vis_analysis_plots"),
+    (["-h"], b"usage: era5vis_analysis_plots"),
+    (["--help"], b"usage: era5vis_analysis_plots"),
+    (["--v"], era5vis.__version__.encode()),
+    (["--version"], era5vis.__version__.encode()),
 ])
-def test_version(capsys, args):
-    """Test that version flags print version information and exit."""
-    # CLI should exit after printing version info
+def test_help_and_version(capfdbinary, args, expected):
+    """Test that help and version flags print their information and exit."""
+    # CLI exit after printing help or version info
     with pytest.raises(SystemExit) as exc:
         analysis_plots(args)
 
     assert exc.value.code == 0
-    captured = capsys.readouterr()
-    assert era5vis.__version__ in captured.out
+    captured = capfdbinary.readouterr()
+    assert expected in captured.out
 
 
 @pytest.mark.parametrize("extra_args", [
@@ -52,7 +63,7 @@ def test_version(capsys, args):
     ["--ti", "0", "--no-browser", "-t", "202510010000"],  # time index instead of explicit time
     ["-t", "202510010000", "--no-browser", "--u1", "u", "--u2", "v"]  # explicit time and wind parameters
 ])
-def test_print_html(capsys, extra_args, retrieve_param_level_time_wind_from_ds):
+def test_print_html(capfdbinary, extra_args, retrieve_param_level_time_wind_from_ds, stub_writers):
     """Test that correctly formatted CLI calls generate HTML output."""
     # retrieve valid parameter, level, time and wind components
     param, level, time, u, v = retrieve_param_level_time_wind_from_ds
@@ -62,15 +73,21 @@ def test_print_html(capsys, extra_args, retrieve_param_level_time_wind_from_ds):
     # run CLI
     analysis_plots(args)
     # capture output
-    captured = capsys.readouterr()
+    captured = capfdbinary.readouterr()
     # verify that file was reported as generated
-    assert "File successfully generated at:" in captured.out
+    assert b"File successfully generated at:" in captured.out
+    # verify that the CLI arguments reached the writer
+    assert stub_writers[-1]["scalar"] == param
+    assert stub_writers[-1]["level"] == level
 
 
-def test_html_print_with_config(capsys, tmp_path, retrieve_param_level_time_wind_from_ds):
+def test_html_print_with_config(capfdbinary, tmp_path, monkeypatch, stub_writers, write_config):
     """Test CLI reading from a YAML configuration file."""
-    # retrieve valid parameter, level, time and wind components
-    param, level, time, u, v = retrieve_param_level_time_wind_from_ds
+    # never open a browser, even if the config's no_browser is not applied
+    opened = []
+    monkeypatch.setattr(
+        "era5vis.analysis_plots._browser", lambda: SimpleNamespace(open_new_tab=opened.append)
+    )
 
     # create temporary YAML config file
     config_file = tmp_path / "config.yaml"
@@ -90,39 +107,59 @@ def test_html_print_with_config(capsys, tmp_path, retrieve_param_level_time_wind
     }
 
     # write YAML configuration to disk
-    with open(config_file, "w") as f:
-        yaml.safe_dump(config_data, f)
+    write_config(config_file, config_data)
 
     # call CLI with only the config file path
     analysis_plots([str(config_file)])
     # capture CLI output
-    captured = capsys.readouterr()
+    captured = capfdbinary.readouterr()
     # verify that file was reported as generated
-    assert "File successfully generated at:" in captured.out
+    assert b"File successfully generated at:" in captured.out
+    # verify that the config values reached the writer
+    assert stub_writers[-1]["scalar"] == "z"
+    assert stub_writers[-1]["level"] == 500
 
 
-@pytest.mark.parametrize("args", [0, 1, 2, 3])
-def test_error(args, incomplete_test_cases):
-    """Test that incomplete config/CLI calls raise a SystemExit."""
-    bad_args = incomplete_test_cases[args]
+# CLI calls missing a required argument
+INCOMPLETE_CASES = [
+    pytest.param(["--pl", "scalar_wind", "-p", "z", "--no-browser"], id="no_level"),
+    pytest.param(["--pl", "scalar_wind", "--lvl", "500", "--no-browser"], id="no_param"),
+]
 
-    with pytest.raises(ValueError) as exc:
+
+@pytest.mark.parametrize("bad_args", INCOMPLETE_CASES)
+def test_error(bad_args):
+    """Test that incomplete CLI calls raise a ValueError."""
+    with pytest.raises(ValueError):
         analysis_plots(bad_args)
 
 
+@pytest.mark.parametrize("config_index", [
+    pytest.param(0, id="no_param"),
+    pytest.param(1, id="no_level"),
+])
+def test_error_config(config_index, temp_incomplete_config_files):
+    """Test that incomplete config files raise a ValueError."""
+    with pytest.raises(ValueError):
+        analysis_plots([str(temp_incomplete_config_files[config_index])])
+
+
 @pytest.mark.parametrize(
-    "config_index, cli_option",
+    "config_index, build_args",
     [
-        (0, "-p"),  # missing parameter in config
-        (1, "--lvl"),  # missing level in config
+        # missing parameter in config
+        pytest.param(0, lambda param, level: ["-p", param, "--lvl", str(level)], id="parameter"),
+        # missing level in config
+        pytest.param(1, lambda param, level: ["--lvl", str(level), "-p", param], id="level"),
     ]
 )
 def test_cli_overrides_config(
-    capsys,
+    capfdbinary,
     config_index,
-    cli_option,
+    build_args,
     temp_incomplete_config_files,
     retrieve_param_level_time_wind_from_ds,
+    stub_writers,
 ):
     """Test that CLI arguments override YAML configuration values."""
     # retrieve valid parameter, level, time and wind components
@@ -130,31 +167,20 @@ def test_cli_overrides_config(
     # select incomplete config file
     config_file = temp_incomplete_config_files[config_index]
 
-    # construct CLI arguments depending on which config value is missing
-    if cli_option == "-p":
-        args = [
-            str(config_file),
-            "-p", param,  # override missing parameter
-            "--lvl", str(level),
-            "--u1", "u",
-            "--u2", "v",
-            "--no-browser",
-            "-t", "202510010000"
-        ]
-    else:
-        args = [
-            str(config_file),
-            "--lvl", str(level),  # override missing level
-            "-p", param,
-            "--u1", "u",
-            "--u2", "v",
-            "--no-browser",
-            "-t", "202510010000"
-        ]
+    # construct CLI arguments, overriding the value missing in the config
+    args = [str(config_file)] + build_args(param, level) + [
+        "--u1", "u",
+        "--u2", "v",
+        "--no-browser",
+        "-t", "202510010000"
+    ]
 
     # run CLI with overrides
     analysis_plots(args)
     # capture output
-    captured = capsys.readouterr()
+    captured = capfdbinary.readouterr()
     # verify that file was reported as generated
-    assert "File successfully generated at:" in captured.out
+    assert b"File successfully generated at:" in captured.out
+    # verify that the overriding CLI values reached the writer
+    assert stub_writers[-1]["scalar"] == param
+    assert stub_writers[-1]["level"] == level
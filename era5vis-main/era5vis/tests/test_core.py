@@ -9,7 +9,7 @@ Updated by Lina Brückner, January 2026:
 
 from pathlib import Path
 
-import xarray as xr
+import pytest
 
 from era5vis import core, cfg
 
@@ -21,94 +21,113 @@ def test_mkdir(tmpdir):
     assert Path.is_dir(Path(directory))
 
 
-def test_write_scalar_with_wind_html(tmp_path):
-    """
-    Check that HTML file is created and the directory contains a PNG file.
-    """
-    # open scalar_wind dataset to get a valid variable, level and time
-    with xr.open_dataset(cfg.example_datafile) as ds:
-        # pick the first variable with a pressure_level dimension
-        param = [
-            v for v in ds.variables
-            if "pressure_level" in ds[v].dims and "longitude" in ds[v].dims
-        ][0]
-        level = int(ds.pressure_level.values[0])
-        time = str(ds.valid_time.values[0])  # convert np.datetime64 to str
-
-    u, v = "u", "v"
+def _scalar_wind_kwargs(probe):
+    param, level, time = probe
+    return dict(scalar=param, u="u", v="v", level=level, time=time)
 
-    # generate HTML
-    htmlfile = core.write_scalar_with_wind_html(
-        scalar=param,
-        u=u,
-        v=v,
-        level=level,
-        time=time,
-        directory=tmp_path,
-        datafile=str(cfg.example_datafile),
-    )
 
-    # check that HTML file exists
-    assert Path.is_file(htmlfile)
-    assert htmlfile.suffix == ".html"
-    # check that a PNG was created in the same directory
-    assert list(htmlfile.parent.glob("*.png"))
+def _skewt_kwargs(probe):
+    lat, lon, time = probe
+    return dict(lat=lat, lon=lon, time=time)
 
 
-def test_write_skewT_html(tmp_path):
+def _vert_cross_kwargs(probe):
+    # (lat, lon) of the transect end points
+    return dict(param="t", start=(40.0, 0.0), end=(60.0, 20.0), time=probe, npoints=50)
+
+
+@pytest.mark.parametrize("writer, probe_name, kwargs_fn", [
+    pytest.param(core.write_scalar_with_wind_html, "scalar_wind_probe", _scalar_wind_kwargs, id="scalar_wind"),
+    pytest.param(core.write_skewT_html, "skewt_probe", _skewt_kwargs, id="skewT"),
+    pytest.param(core.write_vert_cross_html, "vert_cross_probe", _vert_cross_kwargs, id="vert_cross"),
+])
+def test_write_html(tmp_path, request, writer, probe_name, kwargs_fn):
     """
     Check that HTML file is created and the directory contains a PNG file.
     """
-    # open dataset to get valid coordinates and time
-    with xr.open_dataset(cfg.example_datafile) as ds:
-        # pick the first valid latitude, longitude and time
-        lat = float(ds.latitude.values[0])
-        lon = float(ds.longitude.values[0])
-        time = str(ds.valid_time.values[0])
+    # valid plot arguments from the session-wide dataset probe
+    probe = request.getfixturevalue(probe_name)
 
     # generate HTML
-    htmlfile = core.write_skewT_html(
-        lat=lat,
-        lon=lon,
-        time=time,
+    htmlfile = writer(
+        **kwargs_fn(probe),
         directory=tmp_path,
-        datafile=str(cfg.example_datafile)
+        datafile=cfg.example_datafile,
     )
-    
+
     # check that HTML file exists
-    assert htmlfile.exists()
+    assert htmlfile.is_file()
     assert htmlfile.suffix == ".html"
-    
     # check that a PNG was created in the same directory
     assert list(htmlfile.parent.glob("*.png"))
 
 
-
-def test_write_vert_cross_html(tmp_path):
+def test_render_pngs(tmp_path, retrieve_param_level_time_from_ds):
     """
-    Check that vertical cross-section HTML and PNG are created.
+    Check that batch rendering writes every PNG.
     """
+    param, level, time = retrieve_param_level_time_from_ds
+    jobs = [
+        {
+            "plot_type": "scalar_wind",
+            "datafile": cfg.example_datafile,
+            "savepath": tmp_path / f"map_{i}.png",
+            "scalar": param,
+            "level": level,
+            "time": time,
+        }
+        for i in range(2)
+    ]
+
+    # render in this process; the process pool is tested separately
+    pngs = core.render_pngs(jobs, max_workers=1)
+
+    assert pngs == [job["savepath"] for job in jobs]
+    assert all(png.exists() for png in pngs)
+
+
+@pytest.mark.slow
+def test_render_pngs_process_pool(tmp_path, skewt_probe):
+    """
+    Check that batch rendering in worker processes writes every PNG.
+    """
+    lat, lon, time = skewt_probe
+    jobs = [
+        {
+            "plot_type": "skewT",
+            "datafile": cfg.example_datafile,
+            "savepath": tmp_path / f"skewT_{i}.png",
+            "lat": lat,
+            "lon": lon,
+            "time": time,
+        }
+        for i in range(2)
+    ]
+
+    pngs = core.render_pngs(jobs, max_workers=2)
+
+    assert pngs == [job["savepath"] for job in jobs]
+    assert all(png.exists() for png in pngs)
+
+
+@pytest.mark.parametrize("plot_job", [
+    pytest.param({"plot_type": "scalar_wind", "scalar": "t", "level": 2, "time": 0}, id="scalar_wind"),
+    pytest.param({"plot_type": "skewT", "lat": 50.0, "lon": 10.0, "time": "190001010000"}, id="skewT"),
+])
+def test_render_pngs_unavailable_data(tmp_path, plot_job):
+    """
+    Check that the workers validate the requested data before plotting.
+    """
+    job = dict(plot_job, datafile=cfg.example_datafile, savepath=tmp_path / "x.png")
+    with pytest.raises(ValueError):
+        core.render_pngs([job])
+    assert not job["savepath"].exists()
 
-    with xr.open_dataset(cfg.example_datafile) as ds:
-        time = str(ds.valid_time.values[0])
-
-    start = (40.0, 0.0)   # (lat, lon)
-    end = (60.0, 20.0)
-
-    htmlfile = core.write_vert_cross_html(
-        param="t",
-        start=start,
-        end=end,
-        time=time,
-        npoints=50,
-        directory=tmp_path,
-        datafile=str(cfg.example_datafile),
-    )
-
-    # HTML exists
-    assert htmlfile.exists()
-    assert htmlfile.suffix == ".html"
 
-    # PNG exists
-    pngs = list(htmlfile.parent.glob("*.png"))
-    assert len(pngs) > 0
+def test_render_pngs_unknown_plot_type(tmp_path):
+    """
+    Check that an unknown plot type raises a ValueError.
+    """
+    job = {"plot_type": "foo", "datafile": cfg.example_datafile, "savepath": tmp_path / "x.png"}
+    with pytest.raises(ValueError, match="Unknown plot type"):
+        core.render_pngs([job])
@@ -15,29 +15,65 @@ import numpy as np
 import pandas as pd
 import xarray as xr
 
-from era5vis import era5
+from era5vis import cfg, era5
     
 
+def test_open_dataset(datafile, monkeypatch):
+    # the default xarray engine must work as well as the preferred one
+    for engine in (cfg.netcdf_engine, None):
+        monkeypatch.setattr(cfg, "netcdf_engine", engine)
+        with era5.open_dataset(datafile) as ds:
+            assert "valid_time" in ds.coords
+
+
 def test_check_file_availability_valid(datafile):
     era5.check_file_availability(datafile)
 
 
-def test_check_data_availability_valid(retrieve_param_level_time_from_ds, datafile):
+def test_open_dataset_netcdf3(tmp_path):
+    # netCDF3 files are valid input even though h5netcdf cannot read them
+    fpath = tmp_path / "classic.nc"
+    xr.Dataset({"t": ("x", np.arange(3.0))}).to_netcdf(fpath, format="NETCDF3_64BIT")
+
+    with era5.open_dataset(fpath) as ds:
+        np.testing.assert_array_equal(ds["t"].values, np.arange(3.0))
+    era5.check_file_availability(fpath)
+
+
+@pytest.fixture(scope="module")
+def ds(datafile):
+    # dataset shared by the tests of this module, opened once
+    with xr.open_dataset(datafile) as d:
+        yield d
+
+
+def test_check_data_availability_valid(retrieve_param_level_time_from_ds, ds):
     param, level, time = retrieve_param_level_time_from_ds
     era5.check_data_availability(
         param=param,
         level=level,
         time=time,
-        datafile=datafile,
+        ds=ds,
     )
 
 
-def test_check_data_availability_invalid_variable(datafile):
-    with pytest.raises(KeyError):
-        era5.check_data_availability(
-            param="this_variable_does_not_exist",
-            datafile=datafile,
-        )
+@pytest.mark.parametrize("kwargs, error", [
+    pytest.param({"param": "this_variable_does_not_exist"}, KeyError, id="variable"),
+    pytest.param({"param": "t", "level": 2}, ValueError, id="level"),
+    pytest.param({"param": "t", "time": "190001010000"}, ValueError, id="time"),
+    pytest.param({"param": "t", "time_ind": 10_000}, IndexError, id="time_ind"),
+])
+def test_check_data_availability_invalid(ds, kwargs, error):
+    with pytest.raises(error):
+        era5.check_data_availability(**kwargs, ds=ds)
+
+
+def test_horiz_cross_section_with_ds(retrieve_param_level_time_from_ds, ds):
+    # an opened dataset gives the same field as the datafile
+    param, level, time = retrieve_param_level_time_from_ds
+    da = era5.horiz_cross_section(param, level, time, None, ds=ds)
+    expected = era5.horiz_cross_section(param, level, time, cfg.example_datafile)
+    xr.testing.assert_identical(da, expected)
 
 
 def test_horiz_cross_section(retrieve_param_level_time_from_ds, datafile):
@@ -63,3 +99,44 @@ def test_horiz_cross_section(retrieve_param_level_time_from_ds, datafile):
         param=param, lvl=level, time=time_str, datafile=datafile
     )
     assert np.datetime64(da_time.valid_time.item(), "ns") == expected_time
+
+    # test using datetime objects
+    for time in (pd.Timestamp(expected_time), expected_time):
+        da_time = era5.horiz_cross_section(
+            param=param, lvl=level, time=time, datafile=datafile
+        )
+        assert np.datetime64(da_time.valid_time.item(), "ns") == expected_time
+
+
+@pytest.mark.parametrize("use_numba", [False, True])
+def test_transect_interpolator(datafile, use_numba, monkeypatch):
+    """
+    Test that transect interpolation matches xarray's linear interpolation.
+    """
+    if use_numba:
+        # the numba kernel must give the same result as numpy
+        pytest.importorskip("numba")
+    monkeypatch.setattr(cfg, "use_numba", use_numba)
+
+    with xr.open_dataset(datafile) as ds:
+        transect = era5.TransectInterpolator(ds, (40.0, 0.0), (60.0, 20.0), npoints=50)
+        da = transect("t", 0)
+        da_np = transect("t", np.int64(0))
+        frames = transect("t", [0, 0])
+        expected = ds["t"].isel(valid_time=0).interp(
+            latitude=("point", transect.lats),
+            longitude=("point", transect.lons),
+        )
+
+        # points beyond the northern edge of the grid are NaN
+        outside = era5.TransectInterpolator(ds, (60.0, 0.0), (80.0, 0.0), npoints=5)("t", 0)
+
+    assert da.dims == ("pressure_level", "point")
+    np.testing.assert_allclose(da.values, expected.values, rtol=1e-6)
+    # numpy integer scalars are time indices as well
+    np.testing.assert_array_equal(da_np.values, da.values)
+    # several times are returned as frames
+    assert frames.dims == ("frame", "pressure_level", "point")
+    np.testing.assert_allclose(frames.values[1], da.values)
+    assert np.isnan(outside.values[:, -1]).all()
+    assert not np.isnan(outside.values[:, 0]).any()
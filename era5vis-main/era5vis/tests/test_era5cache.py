@@ -7,7 +7,7 @@ Author: Leah Herrfurth
 
 import pytest
 from unittest.mock import patch
-from era5vis.data_access.era5_cache import Era5Cache, request_hash
+from era5vis.data_access.era5_cache import Era5Cache, legacy_request_hash, request_hash
 
 
 @pytest.fixture
@@ -18,54 +18,99 @@ def tmp_cache_dir(tmp_path):
     return tmp_path
 
 
-def test_cached_file_is_reused(tmp_cache_dir):
+@pytest.fixture
+def cache(tmp_cache_dir):
     """
-    Ensure that an existing cached ERA5 file is reused.
+    Provide an ERA5 cache using the temporary cache directory.
     """
-   
-    cache = Era5Cache(cache_dir=tmp_cache_dir)
+    return Era5Cache(cache_dir=tmp_cache_dir)
+
 
-    # build fake request dict to compute expected cache filename
-    request_dict = {
+def _request_dict(variable, pressure_level, year, month, day, time):
+    # ERA5 request dict as built by Era5Cache.get_analysis_plots_data
+    return {
         "product_type": ["reanalysis"],
-        "variable": "t",
-        "year": ["2025"],
-        "month": ["03"],
-        "day": ["02"],
-        "time": ["00:00"],
-        "pressure_level": ["850"],
+        "variable": variable,
+        "year": [year],
+        "month": [month],
+        "day": [day],
+        "time": [time],
+        "pressure_level": pressure_level,
         "data_format": "netcdf",
         "download_format": "unarchived",
         "area": [70, -20, 30, 50],
     }
-    # Compute the cache key and create a fake cached NetCDF file
-    key = request_hash(request_dict)
+
+
+# (get_analysis_plots_data arguments, expected ERA5 request dict)
+CACHE_HIT_CASES = [
+    (
+        {"variables": "t", "level": 850, "time": "2025-03-02T00:00"},
+        _request_dict("t", ["850"], "2025", "03", "02", "00:00"),
+    ),
+    (
+        {"variables": ["z", "u", "v"], "level": [500, 850], "time": "2025-12-01T12:00"},
+        _request_dict(["z", "u", "v"], ["500", "850"], "2025", "12", "01", "12:00"),
+    ),
+]
+
+
+@pytest.fixture(scope="module", params=CACHE_HIT_CASES, ids=["single_level", "multi_level"])
+def cache_key(request):
+    """
+    Provide request arguments and the cache key of the matching ERA5 request.
+    """
+    call_kwargs, request_dict = request.param
+    return call_kwargs, request_hash(request_dict)
+
+
+def test_cached_file_is_reused(cache, tmp_cache_dir, cache_key):
+    """
+    Ensure that an existing cached ERA5 file is reused.
+    """
+    call_kwargs, key = cache_key
+
+    # create a fake cached NetCDF file under the expected cache key
     fake_file = tmp_cache_dir / f"era5_{key}.nc"
     fake_file.touch()  # create cached file
 
-    cache = Era5Cache(cache_dir=tmp_cache_dir)
-
     # patch download to make sure it is not called
     with patch("era5vis.data_access.era5_cache.download_era5_data") as mock_dl:
-        result = cache.get_analysis_plots_data("t", 850, time="2025-03-02T00:00")
-         # The returned file should exist and come from the cache
-        assert result.exists()
-         # Download must not be triggered when cache is present
+        result = cache.get_analysis_plots_data(**call_kwargs)
+        # the returned file should be the cached one
+        assert result == fake_file
+        # download must not be triggered when cache is present
         mock_dl.assert_not_called()
 
 
-def test_download_called_when_cache_missing(tmp_cache_dir):
+@patch("era5vis.data_access.era5_cache.download_era5_data")
+def test_legacy_cached_file_is_reused(mock_dl, cache, tmp_cache_dir):
+    """
+    Ensure that files cached under the earlier SHA-256 names are reused.
+    """
+    call_kwargs, request_dict = CACHE_HIT_CASES[0]
+
+    legacy_file = tmp_cache_dir / f"era5_{legacy_request_hash(request_dict)}.nc"
+    legacy_file.touch()
+
+    assert cache.get_analysis_plots_data(**call_kwargs) == legacy_file
+    mock_dl.assert_not_called()
+
+
+@patch("era5vis.data_access.era5_cache.download_era5_data")
+def test_download_called_when_cache_missing(mock_dl, cache):
     """
     Ensure that the download function is called when the cache is missing.
     """
-    cache = Era5Cache(cache_dir=tmp_cache_dir)
 
     def fake_download(req_dict, target):
         # simulate downloader writing a file
         target.touch()
-        
-     # Patch the download function to simulate successful data retrieval
-    with patch("era5vis.data_access.era5_cache.download_era5_data", side_effect=fake_download):
-        result = cache.get_analysis_plots_data("t", 850, time="2025-12-01T00:00")
-        assert result.exists()
-        assert result.suffix == ".nc"
+
+    # simulate successful data retrieval
+    mock_dl.side_effect = fake_download
+
+    result = cache.get_analysis_plots_data("t", 850, time="2025-12-01T00:00")
+    assert result.exists()
+    assert result.suffix == ".nc"
+    mock_dl.assert_called_once()
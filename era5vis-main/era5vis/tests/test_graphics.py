@@ -8,72 +8,209 @@ Updated by Lina Brückner, January 2026:
     - Updated to single datafile usage
 """
 
+import io
+import os
+import subprocess
+import sys
+
 import matplotlib.pyplot as plt
+import numpy as np
+import pytest
 import xarray as xr
 
 from era5vis import graphics, cfg
 
+# tests sharing the session-wide fields and the module-wide figure are
+# marked to run on one pytest-xdist worker (--dist=loadgroup), so these
+# are read and rendered only once; all other tests are spread freely
 
-def test_plot_scalar_with_wind_labels(retrieve_param_level_from_ds):
-    """Test scalar_wind plotting returns figure with correct labels."""
 
-    param, level = retrieve_param_level_from_ds
-    u, v = "u", "v"
+@pytest.fixture(scope="module")
+def scalar_wind_fig(scalar_wind_arrays, tmp_path_factory):
+    """Render and save one scalar_wind plot shared by the tests below."""
+    fpath = tmp_path_factory.mktemp("scalar_wind") / "scalar_wind_test.png"
+    fig = graphics.plot_scalar_with_wind(*scalar_wind_arrays, savepath=fpath)
+    yield fig, fpath
+    plt.close(fig)
 
-    with xr.open_dataset(cfg.example_datafile) as ds:
-        da = ds[param].sel(pressure_level=level).isel(valid_time=0)
-        u_da = ds[u].sel(pressure_level=level).isel(valid_time=0)
-        v_da = ds[v].sel(pressure_level=level).isel(valid_time=0)
 
-    fig = graphics.plot_scalar_with_wind(da, u_da, v_da)
+@pytest.mark.xdist_group("scalar_wind")
+def test_plot_scalar_with_wind_labels(scalar_wind_arrays, scalar_wind_fig):
+    """Test scalar_wind plotting returns figure with correct labels."""
 
-    texts = [t.get_text() for t in fig.findobj(plt.Text)]
-    assert any("Longitude" in txt for txt in texts)
-    assert any("Latitude" in txt for txt in texts)
-    assert any(da.long_name in txt for txt in texts)
+    da = scalar_wind_arrays[0]
+    fig, _ = scalar_wind_fig
 
-    plt.close(fig)
+    # read the axes labels and title directly, skipping the tick labels
+    ax = fig.axes[0]
+    assert ax.get_xlabel() == "Longitude"
+    assert ax.get_ylabel() == "Latitude"
+    assert da.long_name in ax.get_title()
 
 
-def test_plot_scalar_with_wind_saving(tmp_path, retrieve_param_level_from_ds):
+@pytest.mark.xdist_group("scalar_wind")
+def test_plot_scalar_with_wind_saving(scalar_wind_fig):
     """Test saving scalar_wind plot to PNG."""
 
-    param, level = retrieve_param_level_from_ds
-    u, v = "u", "v"
+    fig, fpath = scalar_wind_fig
 
-    with xr.open_dataset(cfg.example_datafile) as ds:
-        da = ds[param].sel(pressure_level=level).isel(valid_time=0)
-        u_da = ds[u].sel(pressure_level=level).isel(valid_time=0)
-        v_da = ds[v].sel(pressure_level=level).isel(valid_time=0)
+    assert fig is not None
+    assert fpath.exists()
+    assert fpath.suffix == ".png"
 
-    fpath = tmp_path / "scalar_wind_test.png"
 
-    fig = graphics.plot_scalar_with_wind(da, u_da, v_da, savepath=fpath)
+@pytest.mark.xdist_group("scalar_wind")
+def test_plot_scalar_with_wind_contourf(tmp_path, scalar_wind_arrays):
+    """Test saving scalar_wind plot drawn with filled contours."""
+
+    fpath = tmp_path / "scalar_wind_contourf.png"
+
+    fig = graphics.plot_scalar_with_wind(*scalar_wind_arrays, savepath=fpath, style="contourf")
 
-    assert fig is not None
     assert fpath.exists()
-    assert fpath.suffix == ".png"
 
     plt.close(fig)
 
 
-def test_extract_and_plot_skewT(tmp_path):
+@pytest.mark.parametrize("env, backend", [
+    pytest.param({}, "agg", id="default"),
+    pytest.param({"MPLBACKEND": "svg"}, "svg", id="MPLBACKEND"),
+    # no backend is selected; matplotlib picks one on first use
+    pytest.param({"ERA5VIS_INTERACTIVE": "1"}, "none", id="ERA5VIS_INTERACTIVE"),
+])
+def test_backend_selection(env, backend):
+    """Test that importing graphics only selects Agg if no backend was chosen."""
+
+    # run in a fresh interpreter, where era5vis is imported for the first
+    # time; _get_backend_or_none does not resolve the backend itself
+    environ = {
+        k: v for k, v in os.environ.items() if k not in ("MPLBACKEND", "ERA5VIS_INTERACTIVE")
+    }
+    code = (
+        "import era5vis.graphics, matplotlib; "
+        "print(matplotlib.rcParams._get_backend_or_none())"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        env={**environ, **env},
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+
+    assert out.strip().lower() == backend
+
+
+@pytest.mark.parametrize("suffix", [".png", ".svg"])
+def test_savefig_formats(tmp_path, suffix):
+    """Test that PNG compression options are only used for PNG output."""
+    fig = plt.figure()
+    fpath = tmp_path / f"fig{suffix}"
+    graphics._savefig(fig, fpath)
+    plt.close(fig)
+    assert fpath.stat().st_size > 0
+
+
+@pytest.mark.xdist_group("scalar_wind")
+def test_plot_scalar_with_wind_extent(tmp_path, scalar_wind_arrays):
+    """Test that scalar_wind plots can be restricted to a map extent."""
+
+    da, u_da, v_da = scalar_wind_arrays
+
+    extent = [0, 20, 40, 55]
+    fig = graphics.plot_scalar_with_wind(
+        da, u_da, v_da, savepath=tmp_path / "extent.png", extent=extent
+    )
+
+    np.testing.assert_allclose(fig.axes[0].get_extent(), extent)
+
+    plt.close(fig)
+
+
+def test_plot_scalar_with_wind_invalid_style():
+    """Test that an unknown plotting style raises a ValueError."""
+    with pytest.raises(ValueError, match="Unknown style"):
+        graphics.plot_scalar_with_wind(None, None, None, style="contour")
+
+
+def test_feature_geometries_clipped_to_extent():
+    """Test that map features are clipped to the extent and cached."""
+
+    extent = (0.0, 10.0, 40.0, 50.0)
+    geoms = graphics._feature_geometries("coastline", extent)
+
+    for geom in geoms:
+        lon_min, lat_min, lon_max, lat_max = geom.bounds
+        assert lon_min >= extent[0] - 1 and lon_max <= extent[1] + 1
+        assert lat_min >= extent[2] - 1 and lat_max <= extent[3] + 1
+    assert graphics._feature_geometries("coastline", extent) is geoms
+
+
+@pytest.mark.parametrize("extent, scale", [
+    ((-180.0, 180.0, -90.0, 90.0), "110m"),
+    ((0.0, 10.0, 40.0, 50.0), "10m"),
+])
+def test_feature_geometries_scale_from_extent(monkeypatch, extent, scale):
+    """Test that the Natural Earth resolution follows the map extent."""
+
+    scales = []
+    monkeypatch.setattr(
+        graphics, "_scaled_feature_geometries", lambda name, s: scales.append(s) or ()
+    )
+    # bypass the cache of clipped geometries
+    graphics._feature_geometries.__wrapped__("coastline", extent)
+
+    assert scales == [scale]
+
+
+def test_plot_scalar_with_wind_batch(tmp_path):
+    """Test rendering several scalar_wind frames on one reused map."""
+
+    # read only the two plotted levels at the first time
+    with xr.open_dataset(cfg.example_datafile) as ds:
+        subset = ds[["z", "u", "v"]].isel(pressure_level=slice(0, 2), valid_time=0).load()
+    frames = [subset.isel(pressure_level=i) for i in range(subset.sizes["pressure_level"])]
+    fpaths = [tmp_path / f"frame_{i}.png" for i in range(len(frames))]
+
+    out = graphics.plot_scalar_with_wind_batch(
+        [f["z"] for f in frames],
+        [f["u"] for f in frames],
+        [f["v"] for f in frames],
+        fpaths
+    )
+
+    assert out == fpaths
+    assert all(f.exists() for f in fpaths)
+
+
+def test_extract_skewT_profile_with_dewpoint(skewt_probe):
+    """Test that a dewpoint variable is used without reading humidity."""
+
+    lat, lon, time = skewt_probe
+
+    # map the dewpoint to the temperature: no "q" entry is needed
+    p, T, Td, u, v = graphics.extract_skewT_profile(
+        lat, lon, time, cfg.example_datafile,
+        variables={"T": "t", "u": "u", "v": "v", "Td": "t"},
+    )
+
+    np.testing.assert_allclose(Td, T)
+
+
+def test_extract_and_plot_skewT(skewt_probe):
     """
     Test Skew-T profile extraction and plotting.
     """
 
-    # get a valid lat/lon/time from example dataset
-    with xr.open_dataset(cfg.example_datafile) as ds:
-        lat = float(ds.latitude.values[0])
-        lon = float(ds.longitude.values[0])
-        time = str(ds.valid_time.values[0])
+    # valid lat/lon/time from the example dataset's coordinates
+    lat, lon, time = skewt_probe
 
     # extraction
     p, T, Td, u, v = graphics.extract_skewT_profile(
         lat=lat,
         lon=lon,
         time=time,
-        datafile=str(cfg.example_datafile),
+        datafile=cfg.example_datafile,
     )
 
     # basic sanity checks on extracted profiles
@@ -82,9 +219,11 @@ def test_extract_and_plot_skewT(tmp_path):
     assert Td.size == p.size
     assert u.size == p.size
     assert v.size == p.size
+    assert all(isinstance(x, np.ndarray) for x in (p, T, Td, u, v))
+    assert np.all(Td <= T + 1e-6)
 
-    # plotting
-    fpath = tmp_path / "skewT_test.png"
+    # plotting into memory: only a valid PNG is needed, not a file
+    buf = io.BytesIO()
 
     fig = graphics.plot_skewT(
         p=p,
@@ -95,12 +234,11 @@ def test_extract_and_plot_skewT(tmp_path):
         lat=lat,
         lon=lon,
         time=time,
-        savepath=fpath,
+        savepath=buf,
     )
 
     assert fig is not None
-    assert fpath.exists()
-    assert fpath.suffix == ".png"
+    assert buf.getvalue().startswith(b"\x89PNG\r\n\x1a\n")
 
     plt.close(fig)
 
@@ -111,7 +249,7 @@ def test_extract_and_plot_vert_cross_section(tmp_path):
     """
 
     # use example scalar_wind dataset (has pressure levels + z, u, v)
-    datafile = str(cfg.example_datafile)
+    datafile = cfg.example_datafile
 
     # choose a simple transect
     start = (40.0, 0.0)
@@ -119,7 +257,7 @@ def test_extract_and_plot_vert_cross_section(tmp_path):
 
     # extract a valid time from dataset
     with xr.open_dataset(datafile) as ds:
-        time = str(ds.valid_time.values[0])
+        time = np.datetime_as_string(ds.valid_time[0].values)
 
     # --- extraction ---
     da_main, wind_speed, dist = graphics.extract_vert_cross_section(
@@ -137,10 +275,26 @@ def test_extract_and_plot_vert_cross_section(tmp_path):
     assert da_main is not None
     assert da_main.ndim == 2            # (pressure_level, point)
     assert dist.size == da_main.shape[1]
+    assert dist[0] == 0
+    assert np.all(np.diff(dist) > 0)
 
     if wind_speed is not None:
         assert wind_speed.shape == da_main.shape
 
+    # several times are extracted at once as frames
+    frames, wind_frames, _ = graphics.extract_vert_cross_section(
+        param="z",
+        u_param="u",
+        v_param="v",
+        start=start,
+        end=end,
+        time=[time, time],
+        npoints=200,
+        datafile=datafile,
+    )
+    assert frames.shape == (2,) + da_main.shape
+    assert wind_frames.shape == frames.shape
+
     # --- plotting ---
     fpath = tmp_path / "vert_cross_test.png"
 
@@ -3,7 +3,7 @@ Tests for the request_hash function in era5vis.utils.hashing.
 Author: Leah Herrfurth
 """
 
-from era5vis.utils.hashing import request_hash
+from era5vis.utils.hashing import legacy_request_hash, request_hash
 
 
 def test_request_hash_is_deterministic():
@@ -26,3 +26,31 @@ def test_request_hash_is_deterministic():
 
     # The hashes must be identical
     assert request_hash(req1) == request_hash(req2)
+    assert len(request_hash(req1)) == 12
+    assert int(request_hash(req1), 16) >= 0  # hexadecimal
+
+
+def test_request_hash_known_digest():
+    """
+    Verify that the hash of a fixed request, including float exponents
+    and non-ASCII text, does not change.
+    """
+
+    req = {
+        "variable": ["t", "u"],
+        "area": [70, -20, 30, 50],
+        "grid": [1e-7, 1e16, 1e22],
+        "product_type": ["reanalysis"],
+        "note": "Brückner",
+    }
+    assert request_hash(req) == "e1e0135162fb"
+
+
+def test_legacy_request_hash():
+    """
+    Verify that the legacy hash still matches the SHA-256 based cache
+    file names of earlier versions.
+    """
+
+    req = {"variable": ["t"], "pressure_level": ["850"], "year": ["2022"]}
+    assert legacy_request_hash(req) == "98bb1bab1c45"
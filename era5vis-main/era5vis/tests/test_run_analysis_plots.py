@@ -7,7 +7,6 @@ Updated by Lina Brückner, January 2026:
     - Added def test_run_analysis_plots_conflicting_data_source_options
 """
 
-from unittest.mock import patch
 import pytest
 from era5vis.analysis_plots import run_analysis_plots
 from era5vis import cfg
@@ -21,34 +20,54 @@ def tmp_nc_file(tmp_path):
     f.touch()
     return f
 
-def test_run_analysis_plots_sets_cfg_datafile_and_returns_html(tmp_nc_file):
+
+@pytest.fixture(scope="module")
+def fake_html(tmp_path_factory):
     """
-    Set cfg.datafile and return generated HTML path.
+    Provide the HTML file that the patched writers pretend to generate.
     """
+    p = tmp_path_factory.mktemp("html") / "index.html"
+    p.touch()
+    return p
 
-    # simulate the HTML output file that would normally be generated
-    fake_html = tmp_nc_file.parent / "index.html"
-    fake_html.touch()  # create an empty file
 
-    # patch cache to return our tmp file
-    with patch("era5vis.analysis_plots.Era5Cache.get_analysis_plots_data", return_value=tmp_nc_file), \
-        patch("era5vis.core.write_scalar_with_wind_html", return_value=fake_html), \
-        patch("era5vis.core.write_skewT_html", return_value=fake_html), \
-        patch("webbrowser.get"):
+@pytest.fixture(scope="module")
+def fake_vert_cross_html(tmp_path_factory):
+    """
+    Provide the HTML file of a patched vertical cross section writer.
+    """
+    p = tmp_path_factory.mktemp("html") / "vert_cross.html"
+    p.touch()
+    return p
 
-        html_path = run_analysis_plots(
-            parameter="t",
-            level=850,
-            time="2025030200",
-            download_data=True,
-            no_browser=True
-        )
+def test_run_analysis_plots_sets_cfg_datafile_and_returns_html(tmp_nc_file, fake_html, monkeypatch):
+    """
+    Set cfg.datafile and return generated HTML path.
+    """
 
-        # verify that cfg.datafile points to our temporary NetCDF file
-        assert cfg.datafile == tmp_nc_file
+    # restore cfg.datafile after the test
+    monkeypatch.setattr(cfg, "datafile", cfg.datafile)
+    # patch cache to return our tmp file and skip plotting
+    monkeypatch.setattr(
+        "era5vis.analysis_plots.Era5Cache.get_analysis_plots_data",
+        lambda *args, **kwargs: tmp_nc_file,
+    )
+    monkeypatch.setattr("era5vis.core.write_scalar_with_wind_html", lambda *args, **kwargs: fake_html)
+    monkeypatch.setattr("era5vis.core.write_skewT_html", lambda *args, **kwargs: fake_html)
+
+    html_path = run_analysis_plots(
+        parameter="t",
+        level=850,
+        time="2025030200",
+        download_data=True,
+        no_browser=True
+    )
+
+    # verify that cfg.datafile points to our temporary NetCDF file
+    assert cfg.datafile == tmp_nc_file
 
-        # verify that the returned HTML file exists
-        assert html_path.exists()
+    # verify that the returned HTML file exists
+    assert html_path.exists()
 
 
 def test_run_analysis_plots_conflicting_data_source_options(tmp_nc_file):
@@ -74,34 +93,38 @@ def test_run_analysis_plots_raises_on_missing_level():
         run_analysis_plots(parameter="t", level=None)
 
 
-def test_run_analysis_plots_vert_cross_success(tmp_nc_file):
+def test_run_analysis_plots_vert_cross_success(tmp_nc_file, fake_vert_cross_html, monkeypatch):
     """Test that vert_cross plot type triggers core.write_vert_cross_html."""
-    fake_html = tmp_nc_file.parent / "vert_cross.html"
-    fake_html.touch()
 
-    with patch(
-        "era5vis.analysis_plots.Era5Cache.get_analysis_plots_data",
-        return_value=tmp_nc_file,
-    ), patch(
-        "era5vis.core.write_vert_cross_html",
-        return_value=fake_html,
-    ) as mock_vert, patch("webbrowser.get"):
+    # record calls of the vertical cross section writer
+    calls = []
 
-        html_path = run_analysis_plots(
-            plot_type="vert_cross",
-            parameter="z",
-            lat0=45,
-            lon0=-10,
-            lat1=55,
-            lon1=10,
-            time="2025030200",
-            download_data=True,
-            no_browser=True,
-        )
+    def fake_write_vert_cross_html(*args, **kwargs):
+        calls.append(kwargs)
+        return fake_vert_cross_html
 
-        assert mock_vert.called
-        assert html_path.exists()
-        assert html_path.name == "vert_cross.html"
+    monkeypatch.setattr(cfg, "datafile", cfg.datafile)
+    monkeypatch.setattr(
+        "era5vis.analysis_plots.Era5Cache.get_analysis_plots_data",
+        lambda *args, **kwargs: tmp_nc_file,
+    )
+    monkeypatch.setattr("era5vis.core.write_vert_cross_html", fake_write_vert_cross_html)
+
+    html_path = run_analysis_plots(
+        plot_type="vert_cross",
+        parameter="z",
+        lat0=45,
+        lon0=-10,
+        lat1=55,
+        lon1=10,
+        time="2025030200",
+        download_data=True,
+        no_browser=True,
+    )
+
+    assert calls
+    assert html_path.exists()
+    assert html_path.name == "vert_cross.html"
 
 
 def test_run_analysis_plots_vert_cross_missing_coords():
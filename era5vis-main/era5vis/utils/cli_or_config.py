@@ -3,9 +3,5 @@ Utility function to prioritize command-line arguments over configuration file va
 Author: Leah Herrfurth
 """
 def cli_or_config(cli_val, config_val, default=None):
-    if cli_val is not None:
-        return cli_val
-    elif config_val is not None:
-        return config_val
-    else:
-        return default
\ No newline at end of file
+    # the command-line value wins, then the config value, then the default
+    return cli_val if cli_val is not None else config_val if config_val is not None else default
@@ -7,6 +7,15 @@ Author: Leah Herrfurth
 import json
 import hashlib
 
+
+def _canonical_json(request: dict) -> bytes:
+    """
+    Serialize ``request`` to JSON bytes with sorted keys.
+    """
+
+    return json.dumps(request, sort_keys=True).encode()
+
+
 def request_hash(request: dict) -> str:
     """
     The hash is independent of the ordering of dictionary keys, making it
@@ -28,6 +37,29 @@ def request_hash(request: dict) -> str:
     >>> request_hash(request)
     'a1b2c3d4e5f6'
     """
-    
-    payload = json.dumps(request, sort_keys=True).encode()
-    return hashlib.sha256(payload).hexdigest()[:12]
+
+    payload = _canonical_json(request)
+    # BLAKE2b computes the 6-byte (12 hex characters) digest directly
+    # and is faster than SHA-256 on short payloads
+    return hashlib.blake2b(payload, digest_size=6).hexdigest()
+
+
+def legacy_request_hash(request: dict) -> str:
+    """
+    Hash a request as earlier versions did, with SHA-256.
+
+    Files cached under these names are still reused, so that existing
+    caches do not have to be downloaded again.
+
+    Parameters
+    ----------
+    request : dict
+        The request dictionary containing ERA5 parameters or similar data.
+
+    Returns
+    -------
+    str
+        A 12-character hexadecimal string representing the hash of the request.
+    """
+
+    return hashlib.sha256(_canonical_json(request)).hexdigest()[:12]
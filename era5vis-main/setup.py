@@ -178,7 +178,7 @@ setup(
     # Similar to `install_requires` above, these must be valid existing
     # projects.
     extras_require={  # Optional
-        'test': ['pytest'],
+        'test': ['pytest', 'pytest-xdist'],
     },
 
     # If there are data files included in your packages that need to be